@@ -1,10 +1,19 @@
 """Batch processing for multiple PDF files."""
 
 import asyncio
-from fnmatch import fnmatch
+import concurrent.futures
+import logging
+import os
+import statistics
+import time
+from collections import defaultdict, deque
+import re
+from fnmatch import translate as fnmatch_translate
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
+from namingpaper.cache import content_hash
+from namingpaper.config import get_settings
 from namingpaper.models import (
     BatchItem,
     BatchItemStatus,
@@ -16,9 +25,152 @@ from namingpaper.models import (
 from namingpaper.extractor import extract_metadata
 from namingpaper.formatter import build_destination
 from namingpaper.template import build_filename_from_template
-from namingpaper.providers import get_provider
+from namingpaper.providers import get_cached_provider
 from namingpaper.providers.base import AIProvider
-from namingpaper.renamer import check_collision, execute_rename, CollisionStrategy
+from namingpaper.renamer import (
+    check_collision,
+    check_collisions_bulk,
+    execute_rename,
+    CollisionStrategy,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses that still have a pending rename to perform
+_PROCESSABLE: frozenset[BatchItemStatus] = frozenset(
+    {BatchItemStatus.OK, BatchItemStatus.COLLISION}
+)
+
+class TokenBucket:
+    """Proactive rate limiter for provider calls.
+
+    Sleeping before a request keeps a batch under the provider's
+    RPM/TPM quota, which beats hitting 429s and losing the wait to
+    exponential-backoff retries. Refill happens lazily on acquire.
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self._rate = rate_per_minute / 60.0
+        self._capacity = float(rate_per_minute)
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+
+    async def acquire(self, n: float = 1.0) -> None:
+        """Wait until n tokens are available, then consume them.
+
+        Requests larger than the bucket can ever hold are clamped to the
+        capacity: a per-call token estimate above a small TPM quota
+        should drain the full window, not wait forever for a fill level
+        the bucket cannot reach.
+        """
+        n = min(n, self._capacity)
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            if self._tokens >= n:
+                self._tokens -= n
+                return
+            await asyncio.sleep((n - self._tokens) / self._rate)
+
+
+class AdaptiveSemaphore:
+    """Concurrency limiter that adapts to observed completion latency.
+
+    Extraction latency varies widely with page count and provider load,
+    so a fixed --parallel value either under-fills or over-queues the
+    backend. This limiter starts at the requested limit and shrinks the
+    in-flight target when the rolling median latency climbs well above
+    the best median seen so far (a sign the backend is queueing),
+    growing back toward the limit as latency recovers.
+    """
+
+    #: Recompute the target every this many completions
+    RECOMPUTE_EVERY = 4
+
+    def __init__(self, limit: int, window: int = 16):
+        self._max = max(1, limit)
+        self._target = self._max
+        self._active = 0
+        self._completions = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._best_p50: float | None = None
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveSemaphore":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._target)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    async def record(self, latency: float) -> None:
+        """Feed a completion latency and periodically retune the target."""
+        async with self._cond:
+            self._latencies.append(latency)
+            self._completions += 1
+            if (
+                self._completions % self.RECOMPUTE_EVERY != 0
+                or len(self._latencies) < self._latencies.maxlen // 2
+            ):
+                return
+
+            p50 = statistics.median(self._latencies)
+            if self._best_p50 is None or p50 < self._best_p50:
+                self._best_p50 = p50
+
+            if p50 > self._best_p50 * 2 and self._target > 1:
+                self._target -= 1
+            elif p50 < self._best_p50 * 1.25 and self._target < self._max:
+                self._target += 1
+                self._cond.notify()
+
+
+def scan_directory_iter(
+    directory: Path,
+    recursive: bool = False,
+    pattern: str | None = None,
+) -> Iterator[Path]:
+    """Lazily yield PDF files found in a directory.
+
+    Unlike scan_directory, results are unsorted and yielded as found,
+    so very large libraries never need to be held in memory at once.
+
+    Args:
+        directory: Directory to scan
+        recursive: If True, scan subdirectories
+        pattern: Optional glob pattern to filter filenames
+
+    Yields:
+        PDF file paths in discovery order
+    """
+    stack = [directory]
+    # Compile the glob once instead of re-translating it per file
+    matches = re.compile(fnmatch_translate(pattern)).match if pattern else None
+
+    # os.scandir reuses directory-entry metadata, avoiding a stat() per file
+    # that Path.glob/rglob would incur on large trees
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            stack.append(Path(entry.path))
+                        continue
+                    if not entry.name.lower().endswith(".pdf"):
+                        continue
+                    if matches is not None and not matches(entry.name):
+                        continue
+                    if entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path)
+        except OSError:
+            continue
 
 
 def scan_directory(
@@ -36,17 +188,73 @@ def scan_directory(
     Returns:
         List of PDF file paths, sorted by name
     """
-    if recursive:
-        pdf_files = list(directory.rglob("*.pdf"))
-    else:
-        pdf_files = list(directory.glob("*.pdf"))
+    # Sort by name for consistent ordering
+    return sorted(
+        scan_directory_iter(directory, recursive=recursive, pattern=pattern),
+        key=lambda p: p.name.lower(),
+    )
 
-    # Apply filename filter
-    if pattern:
-        pdf_files = [f for f in pdf_files if fnmatch(f.name, pattern)]
 
-    # Sort by name for consistent ordering
-    return sorted(pdf_files, key=lambda p: p.name.lower())
+def _check_pdf_magic(pdf_path: Path) -> bool:
+    """Return True if the file starts with the %PDF magic bytes.
+
+    Uses raw os.open/os.read to skip the BufferedReader allocation that
+    open() would pay for a 5-byte peek.
+    """
+    fd = os.open(pdf_path, os.O_RDONLY)
+    try:
+        return os.read(fd, 5) == b"%PDF-"
+    finally:
+        os.close(fd)
+
+
+def _content_key(pdf_path: Path) -> tuple[int, str] | None:
+    """Content fingerprint (size + full-file BLAKE2b) for dedup.
+
+    Hashing only a prefix would silently merge same-size files that share
+    their leading bytes — common for PDFs from the same publisher — and
+    rename one of them with the other's metadata. The full-file digest is
+    the same one the metadata cache keys on.
+
+    Returns None when the file cannot be read; such files are treated as
+    unique and fail later with a proper per-item error.
+    """
+    try:
+        size = os.stat(pdf_path).st_size
+        return size, content_hash(pdf_path)
+    except OSError:
+        return None
+
+
+def _duplicate_item(
+    pdf_path: Path,
+    rep_item: BatchItem,
+    template: str | None,
+    output_dir: Path | None,
+) -> BatchItem:
+    """Build a BatchItem for a duplicate file from its representative's result."""
+    item = BatchItem(source=pdf_path)
+    metadata = rep_item.metadata
+
+    if metadata is None:
+        # Representative failed or was skipped; mirror its outcome
+        item.status = rep_item.status
+        item.error = rep_item.error
+        return item
+
+    item.metadata = metadata.model_copy()
+    try:
+        if template:
+            filename = build_filename_from_template(metadata, template)
+        else:
+            filename = build_destination(pdf_path, metadata).name
+        item.destination = (output_dir or pdf_path.parent) / filename
+        # Disk collisions are resolved in bulk by process_batch afterwards
+        item.status = BatchItemStatus.OK
+    except Exception as e:
+        item.status = BatchItemStatus.ERROR
+        item.error = str(e)
+    return item
 
 
 async def process_single_file(
@@ -54,6 +262,12 @@ async def process_single_file(
     provider: AIProvider,
     template: str | None = None,
     output_dir: Path | None = None,
+    check_disk: bool = True,
+    provider_name: str | None = None,
+    model_name: str | None = None,
+    ocr_model: str | None = None,
+    cache: bool = True,
+    content_digest: str | None = None,
 ) -> BatchItem:
     """Process a single PDF file for batch operation.
 
@@ -62,6 +276,14 @@ async def process_single_file(
         provider: AI provider for metadata extraction
         template: Optional template for filename formatting
         output_dir: Optional output directory
+        check_disk: Stat the destination for an existing file; process_batch
+            passes False and resolves disk collisions in bulk instead
+        provider_name: Name the provider was resolved from, for cache keying
+        model_name: Model override the provider was built with
+        ocr_model: OCR model override the provider was built with
+        cache: Pass False to skip the metadata cache
+        content_digest: Content hash already computed by the dedup pass,
+            reused for the cache key so the file isn't hashed twice
 
     Returns:
         BatchItem with extraction results
@@ -70,15 +292,33 @@ async def process_single_file(
 
     try:
         # Quick check: skip files that can't be opened
-        with open(pdf_path, "rb") as f:
-            header = f.read(5)
-        if header != b"%PDF-":
+        if not _check_pdf_magic(pdf_path):
             item.status = BatchItemStatus.SKIPPED
             item.error = "Not a valid PDF file"
             return item
 
-        # Extract metadata
-        metadata = await extract_metadata(pdf_path, provider=provider)
+        # Tiny files are almost always broken/placeholder PDFs; skip them
+        # before paying for an LLM round-trip. lstat (not stat) so the
+        # captured result keeps the renamer's symlink check honest.
+        st = os.lstat(pdf_path)
+        min_bytes = get_settings().min_pdf_bytes
+        if st.st_size < min_bytes:
+            item.status = BatchItemStatus.SKIPPED
+            item.error = f"File too small ({st.st_size} bytes, minimum {min_bytes})"
+            return item
+        item.source_stat = st
+
+        # Extract metadata; the names identify the provider configuration
+        # in the metadata-cache key
+        metadata = await extract_metadata(
+            pdf_path,
+            provider=provider,
+            provider_name=provider_name,
+            model_name=model_name,
+            ocr_model=ocr_model,
+            cache=cache,
+            content_digest=content_digest,
+        )
         item.metadata = metadata
 
         # Build destination filename
@@ -95,7 +335,7 @@ async def process_single_file(
             item.destination = pdf_path.parent / filename
 
         # Check for collision
-        if check_collision(item.destination):
+        if check_disk and check_collision(item.destination):
             item.status = BatchItemStatus.COLLISION
         else:
             item.status = BatchItemStatus.OK
@@ -114,7 +354,7 @@ async def process_single_file(
 
 
 async def process_batch(
-    files: list[Path],
+    files: Iterable[Path],
     provider_name: str | None = None,
     model_name: str | None = None,
     ocr_model: str | None = None,
@@ -122,11 +362,12 @@ async def process_batch(
     output_dir: Path | None = None,
     parallel: int = 1,
     progress_callback: Callable[[int, int, BatchItem], None] | None = None,
+    cache: bool = True,
 ) -> list[BatchItem]:
     """Process multiple PDF files.
 
     Args:
-        files: List of PDF file paths
+        files: Iterable of PDF file paths (e.g. from scan_directory_iter)
         provider_name: AI provider name
         model_name: Override the default model for the provider
         ocr_model: Override the Ollama OCR model
@@ -134,58 +375,164 @@ async def process_batch(
         output_dir: Optional output directory
         parallel: Number of concurrent extractions (1 = sequential)
         progress_callback: Called after each file with (current, total, item)
+        cache: Pass False (the CLI's --no-cache) to skip the metadata cache
 
     Returns:
         List of BatchItem results
     """
-    provider = get_provider(provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive="60s")
-    results: list[BatchItem] = []
+    # Materialize once: the progress callback contract needs a total count
+    files = list(files)
+    # 30m residency spans even large directory runs, so Ollama never
+    # reloads a model mid-batch; single-file runs keep their shorter window
+    provider = get_cached_provider(provider_name, model_name, ocr_model, keep_alive="30m")
+    # Start Ollama's multi-second model load now so it overlaps the
+    # hashing and PDF parsing before the first inference; providers
+    # without a warm-up path simply lack the hook
+    if hasattr(provider, "prewarm"):
+        provider.prewarm()
     total = len(files)
 
-    try:
-        if parallel <= 1:
-            # Sequential processing
-            for i, pdf_path in enumerate(files):
-                item = await process_single_file(pdf_path, provider, template, output_dir)
-                results.append(item)
-                if progress_callback:
-                    progress_callback(i + 1, total, item)
-        else:
-            # Parallel processing with semaphore
-            semaphore = asyncio.Semaphore(parallel)
-            lock = asyncio.Lock()
-            completed = 0
-
-            async def process_with_semaphore(pdf_path: Path) -> BatchItem:
-                nonlocal completed
-                async with semaphore:
-                    item = await process_single_file(pdf_path, provider, template, output_dir)
-                    async with lock:
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, total, item)
-                    return item
-
-            results = await asyncio.gather(
-                *[process_with_semaphore(f) for f in files],
-                return_exceptions=True,
+    # Identical files share one extraction; duplicates reuse the
+    # representative's metadata afterwards. The digests are kept so the
+    # metadata cache can key on them instead of hashing each file again.
+    groups: dict[tuple[int, str], int] = {}
+    rep_for: list[int] = []
+    digests: list[str | None] = []
+    for i, pdf_path in enumerate(files):
+        key = _content_key(pdf_path)
+        digests.append(None if key is None else key[1])
+        rep_for.append(i if key is None else groups.setdefault(key, i))
+
+    unique = [i for i in range(total) if rep_for[i] == i]
+    ordered: list[BatchItem | None] = [None] * total
+    completed = 0
+
+    if parallel <= 1:
+        # Sequential processing
+        for i in unique:
+            item = await process_single_file(
+                files[i],
+                provider,
+                template,
+                output_dir,
+                check_disk=False,
+                provider_name=provider_name,
+                model_name=model_name,
+                ocr_model=ocr_model,
+                cache=cache,
+                content_digest=digests[i],
             )
-            # Handle any exceptions that were returned
-            processed_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    item = BatchItem(source=files[i])
+            ordered[i] = item
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, item)
+    else:
+        # Parallel processing with semaphore, clamped so we never
+        # oversubscribe the provider's HTTP connection pool
+        effective = min(parallel, provider.max_concurrency)
+        if effective < parallel:
+            logger.warning(
+                "Clamping --parallel from %d to %d (provider limit)",
+                parallel,
+                effective,
+            )
+        semaphore = AdaptiveSemaphore(effective)
+
+        # Optional proactive throttles: requests and a crude per-call
+        # token estimate (text budget at ~4 chars/token) stay under the
+        # provider quota instead of burning time in 429 retries
+        settings = get_settings()
+        request_bucket = (
+            TokenBucket(settings.requests_per_minute)
+            if settings.requests_per_minute
+            else None
+        )
+        token_bucket = (
+            TokenBucket(settings.tokens_per_minute)
+            if settings.tokens_per_minute
+            else None
+        )
+        estimated_tokens = settings.max_text_chars / 4
+
+        async def process_with_semaphore(index: int, pdf_path: Path) -> tuple[int, BatchItem]:
+            async with semaphore:
+                if request_bucket is not None:
+                    await request_bucket.acquire()
+                if token_bucket is not None:
+                    await token_bucket.acquire(estimated_tokens)
+                start = time.monotonic()
+                try:
+                    item = await process_single_file(
+                        pdf_path,
+                        provider,
+                        template,
+                        output_dir,
+                        check_disk=False,
+                        provider_name=provider_name,
+                        model_name=model_name,
+                        ocr_model=ocr_model,
+                        cache=cache,
+                        content_digest=digests[index],
+                    )
+                except Exception as e:
+                    item = BatchItem(source=pdf_path)
                     item.status = BatchItemStatus.ERROR
-                    item.error = str(result)
-                    processed_results.append(item)
-                else:
-                    processed_results.append(result)
-            results = processed_results
-    finally:
-        if hasattr(provider, "aclose"):
-            await provider.aclose()
+                    item.error = str(e)
+                await semaphore.record(time.monotonic() - start)
+                return index, item
+
+        tasks = [
+            asyncio.create_task(process_with_semaphore(i, files[i]))
+            for i in unique
+        ]
+
+        # Consume in completion order so progress advances as soon as any
+        # file finishes, not behind the slowest one
+        for future in asyncio.as_completed(tasks):
+            index, item = await future
+            ordered[index] = item
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, item)
+
+    # Fill in duplicates from their representative's extraction
+    for i in range(total):
+        rep = rep_for[i]
+        if rep == i:
+            continue
+        item = _duplicate_item(files[i], ordered[rep], template, output_dir)
+        ordered[i] = item
+        completed += 1
+        if progress_callback:
+            progress_callback(completed, total, item)
+
+    # Resolve on-disk collisions in one pass: one directory listing per
+    # destination directory instead of a stat syscall per file
+    pending = [
+        item
+        for item in ordered
+        if item.status == BatchItemStatus.OK and item.destination is not None
+    ]
+    exists = check_collisions_bulk([item.destination for item in pending])
+    for item in pending:
+        if exists[item.destination]:
+            item.status = BatchItemStatus.COLLISION
 
-    return results
+    return ordered
+
+
+def _dest_key(destination: Path) -> bytes:
+    """Case-folded grouping key for a destination path.
+
+    Case-insensitive filesystems (macOS, Windows) treat "A.pdf" and
+    "a.pdf" as the same entry; bytes.lower() is a cheap fast path for
+    the common all-ASCII case.
+    """
+    dest = str(destination)
+    try:
+        return dest.encode("ascii").lower()
+    except UnicodeEncodeError:
+        return dest.casefold().encode("utf-8")
 
 
 def detect_batch_collisions(items: list[BatchItem]) -> list[BatchItem]:
@@ -200,12 +547,12 @@ def detect_batch_collisions(items: list[BatchItem]) -> list[BatchItem]:
         Updated items with collision status
     """
     # Group by destination (include both OK and COLLISION items for cross-detection)
-    # Use case-folded string key for case-insensitive filesystems (macOS, Windows)
-    dest_map: dict[str, list[BatchItem]] = {}
+    dest_map: dict[bytes, list[BatchItem]] = defaultdict(list)
     for item in items:
-        if item.destination and item.status in (BatchItemStatus.OK, BatchItemStatus.COLLISION):
-            key = str(item.destination).casefold()
-            dest_map.setdefault(key, []).append(item)
+        destination = item.destination
+        if destination is None or item.status not in _PROCESSABLE:
+            continue
+        dest_map[_dest_key(destination)].append(item)
 
     # Mark internal collisions
     for dest, colliding_items in dest_map.items():
@@ -217,50 +564,64 @@ def detect_batch_collisions(items: list[BatchItem]) -> list[BatchItem]:
     return items
 
 
-def execute_batch(
+async def execute_batch_async(
     items: list[BatchItem],
     collision_strategy: CollisionStrategy = CollisionStrategy.SKIP,
     copy: bool = False,
     progress_callback: Callable[[int, int, BatchItem], None] | None = None,
+    max_workers: int = 8,
 ) -> BatchResult:
     """Execute rename operations for batch items.
 
+    File operations run in a bounded thread pool so cross-volume copies
+    overlap instead of serializing on each blocking copy/rename. Items
+    that share a destination are grouped and run sequentially within
+    their group: concurrent execute_rename calls would each pass the
+    collision check before any of them creates the file, so SKIP and
+    INCREMENT would silently lose all but one source.
+
     Args:
         items: List of BatchItem to process
         collision_strategy: How to handle collisions
         copy: If True, copy instead of rename
         progress_callback: Called after each file
+        max_workers: Maximum concurrent file operations
 
     Returns:
         BatchResult with summary
     """
     result = BatchResult(total=len(items), items=items)
     total = len(items)
+    semaphore = asyncio.Semaphore(max_workers)
 
-    for i, item in enumerate(items):
-        if item.status == BatchItemStatus.SKIPPED:
+    async def run_one(item: BatchItem) -> BatchItem:
+        status = item.status
+        if status == BatchItemStatus.SKIPPED:
             result.skipped += 1
-        elif item.status == BatchItemStatus.ERROR:
+        elif status == BatchItemStatus.ERROR:
             result.errors += 1
-        elif item.status in (BatchItemStatus.OK, BatchItemStatus.COLLISION):
+        elif status in _PROCESSABLE:
             if item.destination is None or item.metadata is None:
                 item.status = BatchItemStatus.ERROR
                 item.error = "Missing destination or metadata"
                 result.errors += 1
-                continue
+                return item
 
             operation = RenameOperation(
                 source=item.source,
                 destination=item.destination,
                 metadata=item.metadata,
+                source_stat=item.source_stat,
             )
 
             try:
-                outcome = execute_rename(
-                    operation,
-                    collision_strategy=collision_strategy,
-                    copy=copy,
-                )
+                async with semaphore:
+                    outcome = await asyncio.to_thread(
+                        execute_rename,
+                        operation,
+                        collision_strategy=collision_strategy,
+                        copy=copy,
+                    )
                 if outcome is None:
                     item.status = BatchItemStatus.SKIPPED
                     result.skipped += 1
@@ -273,14 +634,65 @@ def execute_batch(
                 item.error = str(e)
                 result.errors += 1
 
+        return item
+
+    # Same-destination items form one sequential group; each rename then
+    # sees its predecessor's result on disk and the collision strategy
+    # applies exactly as in the old sequential loop. Distinct
+    # destinations still overlap in the thread pool.
+    groups: dict[bytes, list[BatchItem]] = defaultdict(list)
+    singles: list[list[BatchItem]] = []
+    for item in items:
+        if item.destination is not None and item.status in _PROCESSABLE:
+            groups[_dest_key(item.destination)].append(item)
+        else:
+            singles.append([item])
+
+    completed = 0
+
+    def advance(item: BatchItem) -> None:
+        nonlocal completed
+        completed += 1
         if progress_callback:
-            progress_callback(i + 1, total, item)
+            progress_callback(completed, total, item)
+
+    async def run_group(group: list[BatchItem]) -> None:
+        for item in group:
+            await run_one(item)
+            advance(item)
+
+    await asyncio.gather(
+        *(run_group(group) for group in (*groups.values(), *singles))
+    )
 
     return result
 
 
+def execute_batch(
+    items: list[BatchItem],
+    collision_strategy: CollisionStrategy = CollisionStrategy.SKIP,
+    copy: bool = False,
+    progress_callback: Callable[[int, int, BatchItem], None] | None = None,
+    runner: asyncio.Runner | None = None,
+) -> BatchResult:
+    """Synchronous wrapper for execute_batch_async.
+
+    Pass a shared asyncio.Runner to reuse the event loop from an earlier
+    phase instead of building a fresh one.
+    """
+    coro = execute_batch_async(
+        items,
+        collision_strategy=collision_strategy,
+        copy=copy,
+        progress_callback=progress_callback,
+    )
+    if runner is not None:
+        return runner.run(coro)
+    return asyncio.run(coro)
+
+
 def process_batch_sync(
-    files: list[Path],
+    files: Iterable[Path],
     provider_name: str | None = None,
     model_name: str | None = None,
     ocr_model: str | None = None,
@@ -288,17 +700,38 @@ def process_batch_sync(
     output_dir: Path | None = None,
     parallel: int = 1,
     progress_callback: Callable[[int, int, BatchItem], None] | None = None,
+    runner: asyncio.Runner | None = None,
+    cache: bool = True,
 ) -> list[BatchItem]:
-    """Synchronous wrapper for process_batch."""
-    return asyncio.run(
-        process_batch(
-            files,
-            provider_name=provider_name,
-            model_name=model_name,
-            ocr_model=ocr_model,
-            template=template,
-            output_dir=output_dir,
-            parallel=parallel,
-            progress_callback=progress_callback,
-        )
+    """Synchronous wrapper for process_batch.
+
+    Safe to call even when an event loop is already running (e.g. from a
+    Jupyter notebook or an async test harness): the batch then runs on a
+    fresh loop in a worker thread instead of asyncio.run, which would
+    raise "asyncio.run() cannot be called from a running event loop".
+
+    Pass a shared asyncio.Runner to keep one loop alive across several
+    phases (the CLI batch command reuses it for the rename phase), which
+    amortizes loop and thread-pool setup across the whole run.
+    """
+    coro = process_batch(
+        files,
+        provider_name=provider_name,
+        model_name=model_name,
+        ocr_model=ocr_model,
+        template=template,
+        output_dir=output_dir,
+        parallel=parallel,
+        progress_callback=progress_callback,
+        cache=cache,
     )
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        if runner is not None:
+            return runner.run(coro)
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
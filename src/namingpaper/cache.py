@@ -0,0 +1,97 @@
+"""Content-addressed cache of extracted paper metadata.
+
+Hashing a PDF is orders of magnitude cheaper than an LLM round trip, so
+repeated runs over the same directory skip the provider entirely for
+files whose bytes have not changed.
+"""
+
+import functools
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+from namingpaper.models import PaperMetadata
+
+try:  # optional extra: namingpaper[fast-json]
+    import orjson
+except ImportError:
+    orjson = None
+
+_CHUNK_SIZE = 1 << 20  # 1 MiB reads keep memory flat for large PDFs
+
+
+def _encode(metadata: PaperMetadata) -> str | bytes:
+    """Serialize metadata for storage, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(metadata.model_dump())
+    return metadata.model_dump_json()
+
+
+def _decode(blob: str | bytes) -> PaperMetadata:
+    """Rebuild metadata from a stored row."""
+    if orjson is not None:
+        return PaperMetadata.model_validate(orjson.loads(blob))
+    return PaperMetadata.model_validate_json(blob)
+
+
+def content_hash(pdf_path: Path) -> str:
+    """BLAKE2b hex digest of the file's bytes, read in chunks."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class MetadataCache:
+    """SQLite-backed map from PDF content hash to PaperMetadata."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = path or Path.home() / ".namingpaper" / "cache.db"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared across the event loop and worker threads;
+        # the lock serializes access, WAL keeps concurrent CLI runs safe
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "hash TEXT PRIMARY KEY, json TEXT NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> PaperMetadata | None:
+        """Return cached metadata for a content hash, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT json FROM metadata WHERE hash = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return _decode(row[0])
+        except ValueError:
+            # Stale/corrupt entry from an older schema; treat as a miss
+            return None
+
+    def put(self, key: str, metadata: PaperMetadata) -> None:
+        """Store metadata under a content hash."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata (hash, json) VALUES (?, ?)",
+                (key, _encode(metadata)),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@functools.cache
+def get_cache() -> MetadataCache:
+    """Get or create the shared metadata cache."""
+    return MetadataCache()
@@ -4,37 +4,59 @@ from pathlib import Path
 import shutil
 import subprocess
 import sys
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.table import Table
 
 from namingpaper import __version__
-from namingpaper.config import get_settings
-from namingpaper.extractor import plan_rename_sync
-from namingpaper.models import BatchItem, BatchItemStatus, LowConfidenceError
-from namingpaper.renamer import (
-    CollisionStrategy,
-    execute_rename,
-    preview_rename,
-    check_collision,
-)
+from namingpaper.models import BatchItemStatus
+from namingpaper.renamer import CollisionStrategy
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from namingpaper.models import BatchItem
+
+# Heavy modules (rich rendering, PDF reader, providers) are imported inside
+# the command bodies so `namingpaper --help` and argument errors don't pay
+# for them. namingpaper.models is already loaded via renamer, so the status
+# style map can live at module scope.
+
+_STATUS_STYLES = {
+    BatchItemStatus.OK: "[green]OK[/green]",
+    BatchItemStatus.COLLISION: "[yellow]COLLISION[/yellow]",
+    BatchItemStatus.ERROR: "[red]ERROR[/red]",
+    BatchItemStatus.PENDING: "[dim]PENDING[/dim]",
+    BatchItemStatus.SKIPPED: "[dim]SKIPPED[/dim]",
+    BatchItemStatus.COMPLETED: "[green]DONE[/green]",
+}
+
+# Cap on rendered preview rows; anything past this shows as a caption count
+_PREVIEW_MAX_ROWS = 500
 
 app = typer.Typer(
     name="namingpaper",
     help="Rename academic papers using AI-extracted metadata.",
     no_args_is_help=True,
 )
-console = Console()
+
+_console: "Console | None" = None
+
+
+def _get_console() -> "Console":
+    """Import Rich and build the shared console on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def _show_version(value: bool) -> None:
     """Print version and exit when --version/-v is provided."""
     if value:
-        console.print(f"namingpaper {__version__}")
+        _get_console().print(f"namingpaper {__version__}")
         raise typer.Exit()
 
 
@@ -54,13 +76,11 @@ def main(
     """namingpaper CLI."""
 
 
-@app.command()
 def version() -> None:
     """Show namingpaper version."""
-    console.print(f"namingpaper {__version__}")
+    _get_console().print(f"namingpaper {__version__}")
 
 
-@app.command()
 def rename(
     pdf_path: Annotated[
         Path,
@@ -137,20 +157,44 @@ def rename(
             help="How to handle filename collisions",
         ),
     ] = CollisionStrategy.SKIP,
+    keep_alive: Annotated[
+        str,
+        typer.Option(
+            "--keep-alive",
+            help="How long Ollama keeps models loaded after the call (e.g. 5m, 0s)",
+        ),
+    ] = "5m",
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Skip the metadata cache and always call the provider",
+        ),
+    ] = False,
 ) -> None:
     """Rename a PDF file based on AI-extracted metadata.
 
     By default, runs in dry-run mode showing what would happen.
     Use --execute to actually rename the file.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from namingpaper.extractor import plan_rename_sync
+    from namingpaper.models import LowConfidenceError
+    from namingpaper.renamer import check_collision, execute_rename, preview_rename
+
+    console = _get_console()
+
     # Check file extension
     if pdf_path.suffix.lower() != ".pdf":
         console.print(f"[red]Error:[/red] File must be a PDF: {pdf_path}")
         raise typer.Exit(1)
 
-    # Validate template if provided
+    # Validate template if provided (also binds the builder used after
+    # extraction so the submodule is only imported once)
     if template:
-        from namingpaper.template import validate_template, get_template
+        from namingpaper.template import build_filename_from_template, get_template, validate_template
         template_str = get_template(template)
         is_valid, error = validate_template(template_str)
         if not is_valid:
@@ -160,7 +204,7 @@ def rename(
     # Extract metadata and plan rename
     with console.status("[bold blue]Extracting metadata..."):
         try:
-            operation = plan_rename_sync(pdf_path, provider_name=provider, model_name=model, ocr_model=ocr_model, keep_alive="0s")
+            operation = plan_rename_sync(pdf_path, provider_name=provider, model_name=model, ocr_model=ocr_model, keep_alive=keep_alive, cache=not no_cache)
         except LowConfidenceError as e:
             console.print(
                 f"[yellow]Skipped:[/yellow] {e}"
@@ -175,7 +219,6 @@ def rename(
 
     # Apply template if provided
     if template:
-        from namingpaper.template import build_filename_from_template
         filename = build_filename_from_template(operation.metadata, template)
         operation.destination = pdf_path.parent / filename
 
@@ -220,8 +263,12 @@ def rename(
         console.print(f"[dim]Dry run mode. Use --execute to {action}.[/dim]")
         return
 
-    # Confirm
+    # Confirm; when stdin is piped there is nobody to answer, so fail fast
+    # instead of hanging on the prompt
     if not yes:
+        if not sys.stdin.isatty():
+            console.print("[red]Non-interactive input: pass --yes to proceed.[/red]")
+            raise typer.Exit(1)
         action = "copy" if copy_mode else "rename"
         confirmed = typer.confirm(f"Proceed with {action}?")
         if not confirmed:
@@ -239,7 +286,6 @@ def rename(
         console.print(f"[green]Renamed to:[/green] {result}")
 
 
-@app.command()
 def batch(
     directory: Annotated[
         Path,
@@ -346,6 +392,13 @@ def batch(
             help="Output results as JSON",
         ),
     ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-cache",
+            help="Skip the metadata cache and always call the provider",
+        ),
+    ] = False,
 ) -> None:
     """Batch rename PDF files in a directory.
 
@@ -369,199 +422,252 @@ def batch(
         detect_batch_collisions,
         execute_batch,
     )
+    from namingpaper.models import BatchItem
     from namingpaper.template import validate_template, get_template
+    from collections import Counter
+    import asyncio
     import json
 
+    # JSON mode keeps stdout machine-readable and never touches Rich: no
+    # console, no progress display, no preview table.
+    console = None if json_output else _get_console()
+    if not json_output:
+        from rich.live import Live
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+        from rich.table import Table
+
     # Validate template if provided
     if template:
         template_str = get_template(template)
         is_valid, error = validate_template(template_str)
         if not is_valid:
-            console.print(f"[red]Invalid template:[/red] {error}")
+            if json_output:
+                typer.echo(f"Invalid template: {error}", err=True)
+            else:
+                console.print(f"[red]Invalid template:[/red] {error}")
             raise typer.Exit(1)
 
     # Scan directory
-    console.print(f"[blue]Scanning[/blue] {directory}...")
+    if not json_output:
+        console.print(f"[blue]Scanning[/blue] {directory}...")
     pdf_files = scan_directory(directory, recursive=recursive, pattern=filter_pattern)
 
     if not pdf_files:
-        console.print("[yellow]No PDF files found.[/yellow]")
+        if not json_output:
+            console.print("[yellow]No PDF files found.[/yellow]")
         raise typer.Exit(0)
 
-    console.print(f"Found [bold]{len(pdf_files)}[/bold] PDF file(s)")
-    console.print()
-
-    # Process files with progress bar
-    items: list[BatchItem] = []
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Extracting metadata...", total=len(pdf_files))
-
-        def on_progress(current: int, total: int, item: BatchItem) -> None:
-            progress.update(task, completed=current, description=f"Processing: {item.source.name[:40]}")
+    if not json_output:
+        console.print(f"Found [bold]{len(pdf_files)}[/bold] PDF file(s)")
+        console.print()
 
-        try:
-            items = process_batch_sync(
-                pdf_files,
-                provider_name=provider,
-                model_name=model,
-                ocr_model=ocr_model,
-                template=template,
-                output_dir=output_dir,
-                parallel=parallel,
-                progress_callback=on_progress,
+    # One event loop is shared by the extract and rename phases so loop
+    # and executor setup is paid once for the whole run
+    with asyncio.Runner() as runner:
+        items: list[BatchItem] = []
+        if json_output:
+            try:
+                items = process_batch_sync(
+                    pdf_files,
+                    provider_name=provider,
+                    model_name=model,
+                    ocr_model=ocr_model,
+                    template=template,
+                    output_dir=output_dir,
+                    parallel=parallel,
+                    runner=runner,
+                    cache=not no_cache,
+                )
+            except Exception as e:
+                typer.echo(f"Error during extraction: {e}", err=True)
+                raise typer.Exit(1)
+        else:
+            # Process files with progress bar; the renderer is shared with
+            # the execute phase below so Rich only builds one live display
+            progress = Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
             )
-        except Exception as e:
-            console.print(f"[red]Error during extraction:[/red] {e}")
-            raise typer.Exit(1)
-
-    # Detect internal collisions
-    items = detect_batch_collisions(items)
-
-    # Compute status counts once
-    ok_count = sum(1 for i in items if i.status == BatchItemStatus.OK)
-    collision_count = sum(1 for i in items if i.status == BatchItemStatus.COLLISION)
-    error_count = sum(1 for i in items if i.status == BatchItemStatus.ERROR)
-    skipped_count = sum(1 for i in items if i.status == BatchItemStatus.SKIPPED)
 
-    # JSON output mode
-    if json_output:
-        output = {
-            "files": [
-                {
+            with progress:
+                task = progress.add_task("Extracting metadata...", total=len(pdf_files))
+
+                def on_progress(current: int, total: int, item: BatchItem) -> None:
+                    progress.update(task, completed=current, description=f"Processing: {item.source.name[:40]}")
+
+                try:
+                    items = process_batch_sync(
+                        pdf_files,
+                        provider_name=provider,
+                        model_name=model,
+                        ocr_model=ocr_model,
+                        template=template,
+                        output_dir=output_dir,
+                        parallel=parallel,
+                        progress_callback=on_progress,
+                        runner=runner,
+                        cache=not no_cache,
+                    )
+                except Exception as e:
+                    console.print(f"[red]Error during extraction:[/red] {e}")
+                    raise typer.Exit(1)
+                finally:
+                    progress.remove_task(task)
+
+        # Detect internal collisions
+        items = detect_batch_collisions(items)
+
+        # Compute status counts in a single pass
+        counts = Counter(i.status for i in items)
+        ok_count = counts[BatchItemStatus.OK]
+        collision_count = counts[BatchItemStatus.COLLISION]
+        error_count = counts[BatchItemStatus.ERROR]
+        skipped_count = counts[BatchItemStatus.SKIPPED]
+
+        # JSON output mode: stream one entry at a time instead of building
+        # the full document in memory (metadata dicts for thousands of items
+        # would otherwise double peak usage). orjson is used when installed
+        # (the fast-json extra); stdlib json is the fallback.
+        if json_output:
+            try:
+                import orjson
+            except ImportError:
+                orjson = None
+
+            def entry(item: BatchItem) -> dict:
+                return {
                     "source": str(item.source),
                     "destination": str(item.destination) if item.destination else None,
                     "status": item.status.value,
                     "error": item.error,
                     "metadata": item.metadata.model_dump() if item.metadata else None,
                 }
-                for item in items
-            ],
-            "summary": {
+
+            summary = {
                 "total": len(items),
                 "ok": ok_count,
                 "collision": collision_count,
                 "error": error_count,
                 "skipped": skipped_count,
-            },
-        }
-        print(json.dumps(output, indent=2))
-        return
-
-    # Display preview table
-    console.print()
-    table = Table(title="Planned Renames", show_lines=True)
-    table.add_column("#", style="dim", width=4)
-    table.add_column("Original", style="cyan", max_width=40)
-    table.add_column("New Name", max_width=50)
-    table.add_column("Status", width=10)
-    table.add_column("Confidence", width=10)
-
-    status_styles = {
-        BatchItemStatus.OK: "[green]OK[/green]",
-        BatchItemStatus.COLLISION: "[yellow]COLLISION[/yellow]",
-        BatchItemStatus.ERROR: "[red]ERROR[/red]",
-        BatchItemStatus.PENDING: "[dim]PENDING[/dim]",
-        BatchItemStatus.SKIPPED: "[dim]SKIPPED[/dim]",
-        BatchItemStatus.COMPLETED: "[green]DONE[/green]",
-    }
+            }
+
+            if orjson is not None:
+                out = sys.stdout.buffer
+                out.write(b'{"files": [')
+                for i, item in enumerate(items):
+                    if i:
+                        out.write(b", ")
+                    out.write(orjson.dumps(entry(item)))
+                out.write(b'], "summary": ' + orjson.dumps(summary) + b"}\n")
+            else:
+                out = sys.stdout
+                out.write('{"files": [')
+                for i, item in enumerate(items):
+                    if i:
+                        out.write(", ")
+                    json.dump(entry(item), out)
+                out.write(f'], "summary": {json.dumps(summary)}}}\n')
+            return
 
-    for i, item in enumerate(items, 1):
-        status_str = status_styles.get(item.status, str(item.status))
-        confidence = f"{item.metadata.confidence:.0%}" if item.metadata else "-"
-        new_name = item.destination.name if item.destination else item.error or "N/A"
+        # Display preview table, streaming rows so large batches show output
+        # immediately instead of waiting for the whole table to materialize.
+        # Rows beyond the cap are summarized in the caption rather than
+        # rendered, which keeps memory flat on 10k-file directories.
+        console.print()
+        table = Table(title="Planned Renames", show_lines=True)
+        table.add_column("#", style="dim", width=4)
+        table.add_column("Original", style="cyan", max_width=40)
+        table.add_column("New Name", max_width=50)
+        table.add_column("Status", width=10)
+        table.add_column("Confidence", width=10)
+
+        with Live(table, console=console, refresh_per_second=4):
+            for i, item in enumerate(items[:_PREVIEW_MAX_ROWS], 1):
+                table.add_row(
+                    str(i),
+                    item.source.name,
+                    f"[red]{item.error}[/red]"
+                    if item.status == BatchItemStatus.ERROR
+                    else (item.destination.name if item.destination else item.error or "N/A"),
+                    _STATUS_STYLES[item.status],
+                    f"{item.metadata.confidence:.0%}" if item.metadata else "-",
+                )
+            if len(items) > _PREVIEW_MAX_ROWS:
+                table.caption = f"... {len(items) - _PREVIEW_MAX_ROWS} more not shown"
+        console.print()
 
-        if item.status == BatchItemStatus.ERROR:
-            new_name = f"[red]{item.error}[/red]"
+        # Summary
+        summary_parts = [f"[green]{ok_count} ready[/green]"]
+        if collision_count:
+            summary_parts.append(f"[yellow]{collision_count} collisions[/yellow]")
+        if skipped_count:
+            summary_parts.append(f"[dim]{skipped_count} skipped[/dim]")
+        if error_count:
+            summary_parts.append(f"[red]{error_count} errors[/red]")
+        console.print(f"Summary: {', '.join(summary_parts)}")
+        console.print()
 
-        table.add_row(
-            str(i),
-            item.source.name,
-            new_name,
-            status_str,
-            confidence,
-        )
+        # Dry run mode
+        if not execute:
+            action = "copy" if output_dir else "rename"
+            console.print(f"[dim]Dry run mode. Use --execute to {action} files.[/dim]")
+            return
 
-    console.print(table)
-    console.print()
+        # Nothing to process
+        if ok_count == 0 and collision_count == 0:
+            console.print("[yellow]No files to process.[/yellow]")
+            return
 
-    # Summary
-    summary_parts = [f"[green]{ok_count} ready[/green]"]
-    if collision_count:
-        summary_parts.append(f"[yellow]{collision_count} collisions[/yellow]")
-    if skipped_count:
-        summary_parts.append(f"[dim]{skipped_count} skipped[/dim]")
-    if error_count:
-        summary_parts.append(f"[red]{error_count} errors[/red]")
-    console.print(f"Summary: {', '.join(summary_parts)}")
-    console.print()
+        # Confirm; when stdin is piped there is nobody to answer, so fail
+        # fast instead of hanging on the prompt
+        if not yes:
+            if not sys.stdin.isatty():
+                console.print("[red]Non-interactive input: pass --yes to proceed.[/red]")
+                raise typer.Exit(1)
+            action = "copy" if output_dir else "rename"
+            if collision == CollisionStrategy.SKIP:
+                processable = ok_count
+            else:
+                processable = ok_count + collision_count
+            confirmed = typer.confirm(
+                f"Proceed with {action} of {processable} file(s)? "
+                f"(Collision strategy: {collision.value})"
+            )
+            if not confirmed:
+                console.print("[yellow]Cancelled.[/yellow]")
+                raise typer.Exit(0)
 
-    # Dry run mode
-    if not execute:
-        action = "copy" if output_dir else "rename"
-        console.print(f"[dim]Dry run mode. Use --execute to {action} files.[/dim]")
-        return
+        # Execute batch
+        console.print()
+        copy_mode = output_dir is not None
 
-    # Nothing to process
-    if ok_count == 0 and collision_count == 0:
-        console.print("[yellow]No files to process.[/yellow]")
-        return
+        with progress:
+            task = progress.add_task("Renaming files...", total=len(items))
 
-    # Confirm
-    if not yes:
-        action = "copy" if output_dir else "rename"
-        if collision == CollisionStrategy.SKIP:
-            processable = ok_count
-        else:
-            processable = ok_count + collision_count
-        confirmed = typer.confirm(
-            f"Proceed with {action} of {processable} file(s)? "
-            f"(Collision strategy: {collision.value})"
-        )
-        if not confirmed:
-            console.print("[yellow]Cancelled.[/yellow]")
-            raise typer.Exit(0)
+            def on_execute_progress(current: int, total: int, item: BatchItem) -> None:
+                progress.update(task, completed=current)
 
-    # Execute batch
-    console.print()
-    copy_mode = output_dir is not None
+            result = execute_batch(
+                items,
+                collision_strategy=collision,
+                copy=copy_mode,
+                progress_callback=on_execute_progress,
+                runner=runner,
+            )
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Renaming files...", total=len(items))
-
-        def on_execute_progress(current: int, total: int, item: BatchItem) -> None:
-            progress.update(task, completed=current)
-
-        result = execute_batch(
-            items,
-            collision_strategy=collision,
-            copy=copy_mode,
-            progress_callback=on_execute_progress,
+        # Final summary
+        console.print()
+        console.print(
+            f"[bold]Complete:[/bold] "
+            f"[green]{result.successful} successful[/green], "
+            f"[yellow]{result.skipped} skipped[/yellow], "
+            f"[red]{result.errors} errors[/red]"
         )
 
-    # Final summary
-    console.print()
-    console.print(
-        f"[bold]Complete:[/bold] "
-        f"[green]{result.successful} successful[/green], "
-        f"[yellow]{result.skipped} skipped[/yellow], "
-        f"[red]{result.errors} errors[/red]"
-    )
-
 
-@app.command()
 def config(
     show: Annotated[
         bool,
@@ -573,6 +679,12 @@ def config(
     ] = False,
 ) -> None:
     """View or manage configuration."""
+    from rich.table import Table
+
+    from namingpaper.config import get_settings
+
+    console = _get_console()
+
     if show:
         settings = get_settings()
         table = Table(title="Current Configuration", show_header=False)
@@ -615,11 +727,14 @@ def config(
         console.print("  - Config file (~/.namingpaper/config.toml)")
 
 
-@app.command()
 def templates() -> None:
     """Show available filename templates."""
+    from rich.table import Table
+
     from namingpaper.template import list_presets
 
+    console = _get_console()
+
     table = Table(title="Available Templates")
     table.add_column("Name", style="cyan")
     table.add_column("Pattern")
@@ -640,7 +755,6 @@ def templates() -> None:
     console.print("[dim]Use with: namingpaper batch --template <name|pattern>[/dim]")
 
 
-@app.command()
 def check(
     provider: Annotated[
         str | None,
@@ -653,6 +767,11 @@ def check(
 ) -> None:
     """Check if your environment is set up correctly."""
     import httpx
+    from rich.table import Table
+
+    from namingpaper.config import get_settings
+
+    console = _get_console()
 
     settings = get_settings()
     provider_name = provider or settings.ai_provider
@@ -671,9 +790,12 @@ def check(
         text_model = settings.model_name or "qwen3:8b"
         base_url = settings.ollama_base_url
 
-        # Check connectivity
+        # Check connectivity; a short connect timeout makes a down server
+        # fail in ~1s instead of blocking the whole check for 5s
         try:
-            resp = httpx.get(f"{base_url}/api/tags", timeout=5.0)
+            timeout = httpx.Timeout(5.0, connect=1.0, read=3.0)
+            with httpx.Client(timeout=timeout) as client:
+                resp = client.get(f"{base_url}/api/tags")
             resp.raise_for_status()
             tag_data = resp.json()
             table.add_row("Ollama server", "[green]OK[/green]", base_url)
@@ -750,7 +872,6 @@ def check(
         raise typer.Exit(1)
 
 
-@app.command()
 def uninstall(
     manager: Annotated[
         str,
@@ -785,6 +906,8 @@ def uninstall(
     ] = False,
 ) -> None:
     """Uninstall namingpaper."""
+    console = _get_console()
+
     manager = manager.lower()
     if manager not in {"auto", "uv", "pipx", "pip"}:
         console.print(f"[red]Error:[/red] Invalid manager '{manager}'. Use auto, uv, pipx, or pip.")
@@ -857,7 +980,6 @@ def uninstall(
     raise typer.Exit(result.returncode)
 
 
-@app.command()
 def update(
     manager: Annotated[
         str,
@@ -885,6 +1007,8 @@ def update(
     ] = False,
 ) -> None:
     """Update namingpaper to the latest version."""
+    console = _get_console()
+
     manager = manager.lower()
     if manager not in {"auto", "uv", "pipx", "pip"}:
         console.print(f"[red]Error:[/red] Invalid manager '{manager}'. Use auto, uv, pipx, or pip.")
@@ -933,5 +1057,26 @@ def update(
     raise typer.Exit(result.returncode)
 
 
+_COMMANDS = (version, rename, batch, config, templates, check, uninstall, update)
+
+
+def _register_commands() -> None:
+    """Register Typer subcommands, pruning to the invoked one when possible.
+
+    Building Click metadata for every command on each run is wasted work
+    when the user asked for exactly one. If argv names a known command,
+    only that one is registered; help, completion and unknown input fall
+    back to registering everything.
+    """
+    requested = sys.argv[1] if len(sys.argv) > 1 else None
+    names = {command.__name__ for command in _COMMANDS}
+    for command in _COMMANDS:
+        if requested not in names or command.__name__ == requested:
+            app.command()(command)
+
+
+_register_commands()
+
+
 if __name__ == "__main__":
     app()
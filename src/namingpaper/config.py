@@ -1,5 +1,6 @@
 """Configuration management for namingpaper."""
 
+import functools
 import tomllib
 from pathlib import Path
 from typing import Literal
@@ -11,10 +12,14 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     """Application settings loaded from environment and config file."""
 
+    # frozen makes instances immutable, which both protects the cached
+    # get_settings() singleton from accidental mutation and lets pydantic
+    # use its faster immutable attribute access
     model_config = SettingsConfigDict(
         env_prefix="NAMINGPAPER_",
         env_file=".env",
         extra="ignore",
+        frozen=True,
     )
 
     # API keys
@@ -38,6 +43,25 @@ class Settings(BaseSettings):
         le=1.0,
         description="Minimum confidence threshold; documents below this are skipped",
     )
+    requests_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="Proactive request-rate cap for batch runs; None disables throttling",
+    )
+    tokens_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="Proactive token-rate cap for batch runs; None disables throttling",
+    )
+    metadata_cache: bool = Field(
+        default=True,
+        description="Cache extracted metadata by PDF content hash across runs",
+    )
+    min_pdf_bytes: int = Field(
+        default=4096,
+        ge=0,
+        description="Minimum file size in bytes; smaller PDFs are skipped as broken",
+    )
 
     # Ollama settings
     ollama_base_url: str = Field(
@@ -47,6 +71,11 @@ class Settings(BaseSettings):
     ollama_ocr_model: str | None = Field(
         default=None, description="Override OCR model for Ollama (default: deepseek-ocr)"
     )
+    ollama_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Max in-flight Ollama requests; match the server's OLLAMA_NUM_PARALLEL",
+    )
 
     # Filename formatting
     max_authors: int = Field(
@@ -60,41 +89,56 @@ class Settings(BaseSettings):
     def load(cls) -> "Settings":
         """Load settings from environment and config file."""
         config_path = Path.home() / ".namingpaper" / "config.toml"
-        file_settings = {}
-
-        if config_path.exists():
-            try:
-                with open(config_path, "rb") as f:
-                    file_settings = tomllib.load(f)
-            except tomllib.TOMLDecodeError as e:
-                raise ValueError(
-                    f"Invalid TOML in config file '{config_path}': {e}"
-                ) from e
-            except PermissionError as e:
-                raise ValueError(
-                    f"Cannot read config file '{config_path}': permission denied"
-                ) from e
-            except OSError as e:
-                raise ValueError(
-                    f"Cannot read config file '{config_path}': {e}"
-                ) from e
-
-        return cls(**file_settings)
-
-
-# Global settings instance
-_settings: Settings | None = None
-
-
+        return cls(**_read_config_file(config_path))
+
+
+# Parsed config files keyed by (path, mtime_ns, size) so settings reloads
+# only re-parse when the file actually changed
+_toml_cache: dict[tuple[str, int, int], dict] = {}
+
+
+def _read_config_file(config_path: Path) -> dict:
+    """Read and parse a TOML config file, memoized on its stat signature."""
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return {}
+    except OSError as e:
+        raise ValueError(
+            f"Cannot read config file '{config_path}': {e}"
+        ) from e
+
+    key = (str(config_path), st.st_mtime_ns, st.st_size)
+    cached = _toml_cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        with open(config_path, "rb") as f:
+            file_settings = tomllib.load(f)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(
+            f"Invalid TOML in config file '{config_path}': {e}"
+        ) from e
+    except PermissionError as e:
+        raise ValueError(
+            f"Cannot read config file '{config_path}': permission denied"
+        ) from e
+    except OSError as e:
+        raise ValueError(
+            f"Cannot read config file '{config_path}': {e}"
+        ) from e
+
+    _toml_cache[key] = file_settings
+    return file_settings
+
+
+@functools.cache
 def get_settings() -> Settings:
     """Get or create the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings.load()
-    return _settings
+    return Settings.load()
 
 
 def reset_settings() -> None:
     """Reset settings (useful for testing)."""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
@@ -1,14 +1,16 @@
 """Orchestrates PDF reading and AI metadata extraction."""
 
 import asyncio
+from collections.abc import Iterable
 from pathlib import Path
 
+from namingpaper.cache import content_hash, get_cache
 from namingpaper.config import get_settings
 from namingpaper.models import LowConfidenceError, PDFContent, PaperMetadata, RenameOperation
 from namingpaper.pdf_reader import extract_pdf_content
 from namingpaper.formatter import build_destination
-from namingpaper.providers import get_provider
-from namingpaper.providers.base import AIProvider
+from namingpaper.providers import get_cached_provider
+from namingpaper.providers.base import AIProvider, PROMPT_VERSION
 
 
 async def extract_metadata(
@@ -18,6 +20,8 @@ async def extract_metadata(
     model_name: str | None = None,
     ocr_model: str | None = None,
     keep_alive: str | None = None,
+    cache: bool = True,
+    content_digest: str | None = None,
 ) -> PaperMetadata:
     """Extract metadata from a PDF file.
 
@@ -28,39 +32,142 @@ async def extract_metadata(
         model_name: Override the default model for the provider
         ocr_model: Override the Ollama OCR model
         keep_alive: Ollama keep_alive duration (e.g., "60s", "0s")
+        cache: Pass False (the CLI's --no-cache) to skip the metadata
+            cache regardless of the configured metadata_cache setting
+        content_digest: Precomputed content hash of the file; batch runs
+            pass the digest from their dedup pass so the file is only
+            read and hashed once
 
     Returns:
         Extracted paper metadata
     """
     # Validate input
-    if not pdf_path.is_file():
-        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-    if pdf_path.suffix.lower() != ".pdf":
-        raise ValueError(f"Not a PDF file: {pdf_path}")
+    _validate_pdf_path(pdf_path)
+
+    # Content-hash cache: unchanged PDFs skip the provider round trip.
+    # Hashing reads the whole file, so it runs off the event loop too;
+    # with a precomputed digest the key is pure string work.
+    cache_key = None
+    if cache:
+        if content_digest is not None:
+            cache_key = _cache_key(
+                pdf_path, provider_name, model_name, ocr_model, content_digest
+            )
+        else:
+            cache_key = await asyncio.to_thread(
+                _cache_key, pdf_path, provider_name, model_name, ocr_model
+            )
+    if cache_key is not None:
+        cached = get_cache().get(cache_key)
+        if cached is not None:
+            _check_confidence(cached)
+            return cached
 
-    # Get provider
-    created_provider = False
+    # Get provider (cached: repeated calls reuse one HTTP connection pool)
     if provider is None:
-        provider = get_provider(provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive)
-        created_provider = True
+        provider = get_cached_provider(provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive)
 
-    # Extract PDF content
-    content = extract_pdf_content(pdf_path)
+    # Extract PDF content off the event loop so concurrent batch tasks can
+    # keep their provider requests in flight while PyMuPDF parses
+    content = await asyncio.to_thread(
+        extract_pdf_content, pdf_path, extract_image=provider.needs_image
+    )
 
     # Extract metadata using AI
-    try:
-        metadata = await provider.extract_metadata(content)
-    finally:
-        if created_provider and hasattr(provider, "aclose"):
-            await provider.aclose()
+    metadata = await provider.extract_metadata(content)
+
+    if cache_key is not None:
+        get_cache().put(cache_key, metadata)
+    _check_confidence(metadata)
+    return metadata
+
+
+def extract_metadata_sync(
+    pdf_path: Path,
+    provider: AIProvider | None = None,
+    provider_name: str | None = None,
+    model_name: str | None = None,
+    ocr_model: str | None = None,
+    keep_alive: str | None = None,
+    cache: bool = True,
+) -> PaperMetadata:
+    """Blocking variant of extract_metadata for single-file CLI runs.
+
+    Calls the provider's synchronous path directly, so providers backed by
+    sync SDK clients never touch an event loop. Arguments match
+    extract_metadata.
+    """
+    _validate_pdf_path(pdf_path)
+
+    cache_key = (
+        _cache_key(pdf_path, provider_name, model_name, ocr_model) if cache else None
+    )
+    if cache_key is not None:
+        cached = get_cache().get(cache_key)
+        if cached is not None:
+            _check_confidence(cached)
+            return cached
+
+    if provider is None:
+        provider = get_cached_provider(provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive)
+
+    content = extract_pdf_content(pdf_path, extract_image=provider.needs_image)
+    metadata = provider.extract_metadata_sync(content)
+
+    if cache_key is not None:
+        get_cache().put(cache_key, metadata)
+    _check_confidence(metadata)
+    return metadata
+
 
-    # Check confidence threshold
+def _cache_key(
+    pdf_path: Path,
+    provider_name: str | None = None,
+    model_name: str | None = None,
+    ocr_model: str | None = None,
+    content_digest: str | None = None,
+) -> str | None:
+    """Cache key for the metadata cache, or None when caching is off.
+
+    The key combines the PDF's content hash with the resolved provider,
+    model, OCR model, and prompt version, so a provider or model switch
+    (or a prompt bump) never serves extractions produced under the old
+    configuration. A caller that already hashed the file (batch dedup)
+    passes content_digest to skip the second full read. Hash failures
+    (unreadable file) return None; the extraction itself will surface
+    the real error.
+    """
+    settings = get_settings()
+    if not settings.metadata_cache:
+        return None
+    digest = content_digest
+    if digest is None:
+        try:
+            digest = content_hash(pdf_path)
+        except OSError:
+            return None
+    provider = provider_name or settings.ai_provider
+    model = model_name or settings.model_name or ""
+    # Only Ollama runs a separate OCR stage; other providers share keys
+    # regardless of the (ignored) ocr_model argument
+    ocr = (ocr_model or settings.ollama_ocr_model or "") if provider == "ollama" else ""
+    return f"{digest}:{provider}:{model}:{ocr}:{PROMPT_VERSION}"
+
+
+def _validate_pdf_path(pdf_path: Path) -> None:
+    """Reject paths that are missing or not PDFs."""
+    if not pdf_path.is_file():
+        raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+    if pdf_path.suffix.lower() != ".pdf":
+        raise ValueError(f"Not a PDF file: {pdf_path}")
+
+
+def _check_confidence(metadata: PaperMetadata) -> None:
+    """Raise LowConfidenceError when below the configured threshold."""
     settings = get_settings()
     if metadata.confidence < settings.min_confidence:
         raise LowConfidenceError(metadata.confidence, settings.min_confidence)
 
-    return metadata
-
 
 async def plan_rename(
     pdf_path: Path,
@@ -69,6 +176,7 @@ async def plan_rename(
     model_name: str | None = None,
     ocr_model: str | None = None,
     keep_alive: str | None = None,
+    cache: bool = True,
 ) -> RenameOperation:
     """Plan a rename operation for a PDF file.
 
@@ -79,11 +187,12 @@ async def plan_rename(
         model_name: Override the default model for the provider
         ocr_model: Override the Ollama OCR model
         keep_alive: Ollama keep_alive duration (e.g., "60s", "0s")
+        cache: Pass False to skip the metadata cache
 
     Returns:
         Planned rename operation with metadata
     """
-    metadata = await extract_metadata(pdf_path, provider, provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive)
+    metadata = await extract_metadata(pdf_path, provider, provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive, cache=cache)
     destination = build_destination(pdf_path, metadata)
 
     return RenameOperation(
@@ -93,6 +202,51 @@ async def plan_rename(
     )
 
 
+async def plan_rename_many(
+    paths: Iterable[Path],
+    provider: AIProvider | None = None,
+    provider_name: str | None = None,
+    concurrency: int = 8,
+) -> list[RenameOperation | BaseException]:
+    """Plan renames for many PDFs with provider calls overlapped.
+
+    All files share one provider instance (and its HTTP connection pool);
+    a semaphore bounds how many extractions are in flight at once. Results
+    come back in input order, with per-file failures returned in place as
+    exceptions rather than aborting the batch.
+    """
+    if provider is None:
+        provider = get_cached_provider(provider_name)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def plan_one(pdf_path: Path) -> RenameOperation:
+        async with semaphore:
+            return await plan_rename(pdf_path, provider)
+
+    return await asyncio.gather(
+        *(plan_one(p) for p in paths), return_exceptions=True
+    )
+
+
+def plan_rename_many_sync(
+    paths: Iterable[Path],
+    provider: AIProvider | None = None,
+    provider_name: str | None = None,
+    concurrency: int = 8,
+) -> list[RenameOperation | BaseException]:
+    """Blocking wrapper around plan_rename_many for sync callers.
+
+    One asyncio.run covers the whole batch, so the event-loop setup cost is
+    paid once rather than per file.
+    """
+    return asyncio.run(
+        plan_rename_many(
+            paths, provider=provider, provider_name=provider_name, concurrency=concurrency
+        )
+    )
+
+
 def plan_rename_sync(
     pdf_path: Path,
     provider: AIProvider | None = None,
@@ -100,6 +254,18 @@ def plan_rename_sync(
     model_name: str | None = None,
     ocr_model: str | None = None,
     keep_alive: str | None = None,
+    cache: bool = True,
 ) -> RenameOperation:
-    """Synchronous wrapper for plan_rename."""
-    return asyncio.run(plan_rename(pdf_path, provider, provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive))
+    """Synchronous counterpart of plan_rename.
+
+    Uses the providers' blocking extraction path instead of asyncio.run, so a
+    single-file rename pays no event-loop setup cost.
+    """
+    metadata = extract_metadata_sync(pdf_path, provider, provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive, cache=cache)
+    destination = build_destination(pdf_path, metadata)
+
+    return RenameOperation(
+        source=pdf_path,
+        destination=destination,
+        metadata=metadata,
+    )
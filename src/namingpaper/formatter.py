@@ -1,5 +1,6 @@
 """Filename formatting from metadata."""
 
+import functools
 import re
 import unicodedata
 from pathlib import Path
@@ -7,19 +8,41 @@ from pathlib import Path
 from namingpaper.config import get_settings
 from namingpaper.models import PaperMetadata
 
-_RE_INVALID_CHARS = re.compile(r'[<>:"/\\|?*]')
+# str.translate over a fixed table is a single C-level pass, cheaper than
+# re.sub for a small character class
+_INVALID_TABLE = str.maketrans("", "", '<>:"/\\|?*')
 _RE_WHITESPACE = re.compile(r"[\s_]+")
 
 
+@functools.cache
+def _control_char_table() -> dict[int, None]:
+    """Deletion table for BMP code points in a C (control/other) category.
+
+    Built lazily on the first non-ASCII filename so import stays cheap.
+    """
+    return {
+        cp: None
+        for cp in range(0x10000)
+        if unicodedata.category(chr(cp)).startswith("C")
+    }
+
+
 def sanitize_filename(name: str) -> str:
     """Remove or replace characters that are invalid in filenames."""
     # Normalize unicode (skip for pure ASCII)
     if not name.isascii():
-        name = unicodedata.normalize("NFKD", name)
-        # Remove control characters
-        name = "".join(c for c in name if not unicodedata.category(c).startswith("C"))
+        # Unicode Quick Check: most Latin-script titles are already
+        # NFKD-stable, so the full decomposition pass can be skipped
+        if not unicodedata.is_normalized("NFKD", name):
+            name = unicodedata.normalize("NFKD", name)
+        # Remove control characters: one translate pass for BMP input; the
+        # per-character filter remains for rare astral-plane strings
+        if max(name) <= "\uffff":
+            name = name.translate(_control_char_table())
+        else:
+            name = "".join(c for c in name if not unicodedata.category(c).startswith("C"))
     # Replace path separators and other problematic characters
-    name = _RE_INVALID_CHARS.sub("", name)
+    name = name.translate(_INVALID_TABLE)
     # Replace multiple spaces/underscores with single space
     name = _RE_WHITESPACE.sub(" ", name)
     # Strip leading/trailing whitespace and dots
@@ -92,12 +115,11 @@ def format_journal(journal: str, journal_abbrev: str | None) -> str:
 
 def format_title(title: str, max_words: int = 6) -> str:
     """Format title for filename, truncating if needed."""
-    # Take first N words
-    all_words = title.split()
-    words = all_words[:max_words]
-    result = " ".join(words)
-    # Add ellipsis if truncated
-    if len(all_words) > max_words:
+    # maxsplit stops tokenizing after the words we keep; an extra trailing
+    # element is the signal that the title was truncated
+    parts = title.split(maxsplit=max_words)
+    result = " ".join(parts[:max_words])
+    if len(parts) > max_words:
         result = result.rstrip(".,;:") + "..."
     return result
 
@@ -123,10 +145,11 @@ def build_filename(
     journal_str = format_journal(metadata.journal, metadata.journal_abbrev)
     title_str = format_title(metadata.title)
 
-    # Build the filename
-    filename = f"{authors_str}, ({metadata.year}, {journal_str}), {title_str}.pdf"
-
-    # Sanitize
+    # join sizes one allocation from the parts, skipping format machinery
+    filename = "".join(
+        [authors_str, ", (", str(metadata.year), ", ", journal_str, "), ", title_str, ".pdf"]
+    )
+    # Sanitize the assembled name once rather than per component
     filename = sanitize_filename(filename)
 
     # Truncate if too long (preserve .pdf extension, cut at word boundary)
@@ -1,13 +1,21 @@
 """Data models for namingpaper."""
 
-from enum import Enum
+import base64
+import functools
+import os
+from enum import StrEnum
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 
 class PaperMetadata(BaseModel):
-    """Metadata extracted from an academic paper."""
+    """Metadata extracted from an academic paper.
+
+    Fields hold the text exactly as extracted; filename sanitization
+    happens in the formatter/template layer so JSON output and cached
+    metadata keep the paper's real punctuation.
+    """
 
     authors: list[str] = Field(min_length=1, description="List of author last names")
     authors_full: list[str] = Field(
@@ -41,12 +49,38 @@ class PDFContent(BaseModel):
 
     text: str = Field(description="Extracted text from PDF")
     first_page_image: bytes | None = Field(
-        default=None, description="First page as image bytes (PNG)"
+        default=None, description="First page as image bytes (JPEG)"
     )
     path: Path = Field(description="Original file path")
 
     model_config = {"arbitrary_types_allowed": True}
 
+    @functools.cached_property
+    def first_page_image_b64(self) -> str | None:
+        """Base64 of the page image, encoded once and shared by providers.
+
+        Encoding a page render is an O(size) pass with a large transient
+        allocation; caching it here means retries and provider fallbacks
+        pay it only once.
+        """
+        if self.first_page_image is None:
+            return None
+        return base64.standard_b64encode(self.first_page_image).decode("utf-8")
+
+    @functools.cached_property
+    def first_page_image_mime(self) -> str | None:
+        """Media type of the page image, sniffed from its magic bytes.
+
+        Rendered pages are always JPEG, but embedded page images pass
+        through in their original format, so PNG bytes must be declared
+        as PNG — providers validate the payload against the stated type.
+        """
+        if self.first_page_image is None:
+            return None
+        if self.first_page_image.startswith(b"\x89PNG"):
+            return "image/png"
+        return "image/jpeg"
+
 
 class RenameOperation(BaseModel):
     """Represents a file rename operation."""
@@ -54,12 +88,23 @@ class RenameOperation(BaseModel):
     source: Path = Field(description="Original file path")
     destination: Path = Field(description="New file path")
     metadata: PaperMetadata = Field(description="Extracted metadata")
+    source_stat: os.stat_result | None = Field(
+        default=None,
+        exclude=True,
+        description="lstat of the source captured by the caller, so the "
+        "renamer can validate without re-statting",
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
 
-class BatchItemStatus(str, Enum):
-    """Status of a batch item."""
+class BatchItemStatus(StrEnum):
+    """Status of a batch item.
+
+    StrEnum keeps the JSON status values stable while giving plain-string
+    comparison semantics in the hot batch loops; an IntEnum would compare
+    marginally faster but change the published --json contract.
+    """
 
     PENDING = "pending"
     OK = "ok"
@@ -77,6 +122,11 @@ class BatchItem(BaseModel):
     metadata: PaperMetadata | None = Field(default=None, description="Extracted metadata")
     status: BatchItemStatus = Field(default=BatchItemStatus.PENDING)
     error: str | None = Field(default=None, description="Error message if failed")
+    source_stat: os.stat_result | None = Field(
+        default=None,
+        exclude=True,
+        description="lstat of the source captured during processing",
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
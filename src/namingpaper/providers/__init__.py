@@ -1,12 +1,64 @@
 """AI provider registry."""
 
+import asyncio
+import atexit
 from typing import TYPE_CHECKING
 
-from namingpaper.config import get_settings
-
 if TYPE_CHECKING:
     from namingpaper.providers.base import AIProvider
 
+# Settings (and with it pydantic) are imported inside get_provider so that
+# importing this package stays near-free for callers that never build one.
+
+# Providers are expensive to build (HTTP pools, TLS handshakes), so reuse
+# them across calls within one process and close them at exit
+_provider_cache: dict[tuple, "AIProvider"] = {}
+
+
+def get_cached_provider(
+    provider_name: str | None = None,
+    model_name: str | None = None,
+    ocr_model: str | None = None,
+    keep_alive: str | None = None,
+) -> "AIProvider":
+    """Get or create a process-wide cached provider for a configuration.
+
+    Callers must not close the returned provider; cached instances are
+    torn down once at process exit.
+    """
+    key = (provider_name, model_name, ocr_model, keep_alive)
+    provider = _provider_cache.get(key)
+    if provider is None:
+        provider = get_provider(
+            provider_name, model_name=model_name, ocr_model=ocr_model, keep_alive=keep_alive
+        )
+        _provider_cache[key] = provider
+    return provider
+
+
+def _close_cached_providers() -> None:
+    """Close all cached providers (registered to run at process exit)."""
+    providers = list(_provider_cache.values())
+    _provider_cache.clear()
+    closable = [p for p in providers if hasattr(p, "aclose")]
+    if not closable:
+        return
+
+    async def _close_all() -> None:
+        for provider in closable:
+            try:
+                await provider.aclose()
+            except Exception:
+                pass
+
+    try:
+        asyncio.run(_close_all())
+    except RuntimeError:
+        pass
+
+
+atexit.register(_close_cached_providers)
+
 
 def get_provider(
     provider_name: str | None = None,
@@ -29,6 +81,8 @@ def get_provider(
     Raises:
         ValueError: If provider is not supported or not installed.
     """
+    from namingpaper.config import get_settings
+
     settings = get_settings()
     name = provider_name or settings.ai_provider
     model = model_name or settings.model_name
@@ -1,5 +1,6 @@
 """Abstract base class for AI providers."""
 
+import asyncio
 import json
 import re
 from abc import ABC, abstractmethod
@@ -8,8 +9,65 @@ from pydantic import ValidationError
 
 from namingpaper.models import PDFContent, PaperMetadata
 
-_RE_JSON_BLOCK = re.compile(r"```json\s*(.*?)```", re.DOTALL)
-_RE_CODE_BLOCK = re.compile(r"```\s*(.*?)```", re.DOTALL)
+try:  # optional extra: namingpaper[fast-json]
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+    # except clauses below cover both decoders
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# One alternation covers fenced code blocks (with or without a language
+# tag) and bare JSON objects/arrays embedded in prose, so a response is
+# scanned at most once
+_RE_JSON = re.compile(r"```(?:json)?\s*(.*?)\s*```|(\{.*\}|\[.*\])", re.DOTALL)
+
+
+# Part of the metadata cache key: bump whenever EXTRACTION_PROMPT (or how
+# it is presented to models) changes meaningfully, so stale cached
+# extractions from the old prompt are not reused
+PROMPT_VERSION = "v1"
+
+class JsonBraceCounter:
+    """Tracks JSON object depth across streamed response chunks.
+
+    Streaming providers use it to stop reading as soon as the top-level
+    object closes. Quoted strings (including escaped quotes) are skipped
+    when counting, so a brace inside a paper title cannot end the scan
+    early and truncate the stream mid-object.
+    """
+
+    def __init__(self, depth: int = 0):
+        # Claude's "{" prefill opens the object before the stream starts,
+        # so callers may begin at depth 1
+        self.depth = depth
+        self.started = depth > 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> None:
+        """Advance the state across one chunk of response text."""
+        for char in chunk:
+            if self._escaped:
+                self._escaped = False
+            elif self._in_string:
+                if char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}":
+                self.depth -= 1
+
+    @property
+    def closed(self) -> bool:
+        """True once the top-level object has opened and closed."""
+        return self.started and self.depth <= 0
 
 
 EXTRACTION_PROMPT = """Extract metadata from this academic paper.
@@ -43,6 +101,14 @@ Only return valid JSON, no other text."""
 class AIProvider(ABC):
     """Abstract base class for AI providers."""
 
+    # Maximum concurrent extract_metadata calls the provider can sustain.
+    # Matches the httpx default connection-pool size; subclasses may lower it.
+    max_concurrency: int = 100
+
+    # Whether the provider consumes the first-page image. Text-only
+    # subclasses set this to False so the PDF reader skips rasterization.
+    needs_image: bool = True
+
     @abstractmethod
     async def extract_metadata(self, content: PDFContent) -> PaperMetadata:
         """Extract paper metadata using the AI model.
@@ -55,36 +121,49 @@ class AIProvider(ABC):
         """
         pass
 
+    def extract_metadata_sync(self, content: PDFContent) -> PaperMetadata:
+        """Blocking variant of extract_metadata for one-shot callers.
+
+        Providers backed by synchronous SDK clients override this so a
+        single-file CLI run skips event-loop construction entirely; the
+        default runs the async path on a fresh loop.
+        """
+        return asyncio.run(self.extract_metadata(content))
+
     def _truncate_text(self, text: str, max_chars: int) -> str:
         """Truncate text to fit within token limits."""
         if len(text) <= max_chars:
             return text
-        return text[:max_chars] + "\n\n[Text truncated...]"
+        # join sizes the result once instead of growing through +
+        return "".join((text[:max_chars], "\n\n[Text truncated...]"))
 
     def _parse_response_json(self, response_text: str, provider_name: str) -> PaperMetadata:
         """Extract JSON from AI response text and return PaperMetadata.
 
-        Handles responses wrapped in markdown code blocks.
+        Handles responses wrapped in markdown code blocks or surrounded
+        by prose.
         """
-        json_text = response_text
-        match = _RE_JSON_BLOCK.search(response_text)
-        if match:
-            json_text = match.group(1)
-        else:
-            match = _RE_CODE_BLOCK.search(response_text)
-            if match:
-                json_text = match.group(1)
-
+        # Fast path: models that follow the prompt return bare JSON, which
+        # parses directly with no regex pass at all
         try:
-            data = json.loads(json_text.strip())
-        except json.JSONDecodeError as e:
-            raise RuntimeError(
-                f"Failed to parse JSON from {provider_name} response: {e}\n"
-                f"Response: {response_text[:500]}"
-            ) from e
+            data = _loads(response_text)
+        except json.JSONDecodeError:
+            match = _RE_JSON.search(response_text)
+            json_text = response_text
+            if match:
+                json_text = match.group(1) or match.group(2)
+            try:
+                data = _loads(json_text.strip())
+            except json.JSONDecodeError as e:
+                raise RuntimeError(
+                    f"Failed to parse JSON from {provider_name} response: {e}\n"
+                    f"Response: {response_text[:500]}"
+                ) from e
 
         try:
-            return PaperMetadata(**data)
+            # model_validate hands the dict straight to pydantic-core,
+            # skipping the Python kwargs-unpacking path
+            return PaperMetadata.model_validate(data)
         except ValidationError as e:
             raise RuntimeError(
                 f"{provider_name} returned malformed metadata: {e}"
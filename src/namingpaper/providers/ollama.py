@@ -1,7 +1,8 @@
 """Ollama provider implementation for local models."""
 
-import base64
+import asyncio
 import logging
+import re
 
 import httpx
 
@@ -9,6 +10,11 @@ from namingpaper.config import get_settings
 from namingpaper.models import PDFContent, PaperMetadata
 from namingpaper.providers.base import AIProvider, EXTRACTION_PROMPT
 
+# A publication year or an "Abstract" heading near the top is a cheap
+# signal that the embedded text layer is real paper text rather than
+# OCR-worthy garbage from a scan
+_RE_METADATA_HINT = re.compile(r"\b(?:19|20)\d{2}\b|abstract", re.IGNORECASE)
+
 
 class OllamaProvider(AIProvider):
     """Ollama provider for local LLM inference.
@@ -36,11 +42,28 @@ class OllamaProvider(AIProvider):
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
         self.keep_alive = keep_alive
         self._client: httpx.AsyncClient | None = None
+        self._warmup_tasks: list[asyncio.Task] = []
+        settings = get_settings()
+        # A local server answers as many requests in parallel as its
+        # OLLAMA_NUM_PARALLEL allows; batch clamps its semaphore to this
+        self.max_concurrency = settings.ollama_concurrency
+        # Read once; saves a settings lookup on every extraction
+        self._max_text_chars = settings.max_text_chars
 
     async def aclose(self) -> None:
-        """Unload models and close the underlying HTTP client."""
+        """Close the underlying HTTP client.
+
+        Models are only force-unloaded when keep_alive is "0s"; otherwise
+        they stay warm on the server so the next CLI invocation skips the
+        multi-second model reload.
+        """
+        for task in self._warmup_tasks:
+            if not task.done():
+                task.cancel()
+        self._warmup_tasks.clear()
         if self._client is not None and not self._client.is_closed:
-            await self._unload_models()
+            if self.keep_alive == "0s":
+                await self._unload_models()
             await self._client.aclose()
             self._client = None
 
@@ -56,7 +79,30 @@ class OllamaProvider(AIProvider):
             except httpx.HTTPError:
                 pass
 
+    def prewarm(self) -> None:
+        """Kick off a zero-token load of the text model, without awaiting.
+
+        Called by process_batch right after provider construction (and by
+        the async context manager); model loading (seconds of GPU
+        transfer for an 8B model) then overlaps the PDF parsing that
+        happens before the first inference. Failures are swallowed; a
+        real connection error surfaces on the first extraction with its
+        full guidance.
+        """
+
+        async def _load(model: str) -> None:
+            try:
+                await self._get_client().post(
+                    f"{self.base_url}/api/generate",
+                    json={"model": model, "prompt": "", "keep_alive": self.keep_alive},
+                )
+            except httpx.HTTPError:
+                pass
+
+        self._warmup_tasks.append(asyncio.create_task(_load(self.text_model)))
+
     async def __aenter__(self) -> "OllamaProvider":
+        self.prewarm()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -67,15 +113,14 @@ class OllamaProvider(AIProvider):
 
         If text extraction already produced usable text, skip the slow OCR stage
         and go straight to metadata parsing. Only fall back to OCR when text is
-        missing or too short to be useful.
+        missing, too short, or lacks any metadata-looking content.
         """
-        settings = get_settings()
-
-        if content.text and len(content.text.strip()) > 100:
+        stripped = content.text.strip() if content.text else ""
+        if len(stripped) > 100 and _RE_METADATA_HINT.search(stripped[:2000]):
             combined_text = content.text
         elif content.first_page_image:
             try:
-                ocr_text = await self._ocr_extract(content.first_page_image)
+                ocr_text = await self._ocr_extract(content.first_page_image_b64)
                 combined_text = f"{ocr_text}\n\n{content.text}" if content.text else ocr_text
             except RuntimeError:
                 logging.getLogger(__name__).warning(
@@ -86,13 +131,26 @@ class OllamaProvider(AIProvider):
             combined_text = content.text
 
         # Stage 2: Parse metadata using text model
-        text = self._truncate_text(combined_text, settings.max_text_chars)
+        text = self._truncate_text(combined_text, self._max_text_chars)
         return await self._parse_metadata(text)
 
-    async def _ocr_extract(self, image_data: bytes) -> str:
-        """Stage 1: Extract text from image using OCR model."""
-        image_b64 = base64.standard_b64encode(image_data).decode("utf-8")
+    def extract_metadata_sync(self, content: PDFContent) -> PaperMetadata:
+        """Blocking variant for one-shot callers.
+
+        Extraction and client teardown run on the same fresh event loop so the
+        async HTTP client is never left bound to a closed loop.
+        """
 
+        async def _run() -> PaperMetadata:
+            try:
+                return await self.extract_metadata(content)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_run())
+
+    async def _ocr_extract(self, image_b64: str) -> str:
+        """Stage 1: Extract text from image using OCR model."""
         payload = {
             "model": self.ocr_model,
             "messages": [
@@ -114,18 +172,21 @@ class OllamaProvider(AIProvider):
 
     async def _parse_metadata(self, text: str) -> PaperMetadata:
         """Stage 2: Parse metadata from text using text model."""
-        prompt = f"Paper text:\n\n{text}\n\n{EXTRACTION_PROMPT}"
-
+        # Text and prompt travel as separate chat messages, skipping the
+        # copy that concatenating them into one prompt string would cost
         payload = {
             "model": self.text_model,
-            "prompt": prompt,
+            "messages": [
+                {"role": "user", "content": f"Paper text:\n\n{text}"},
+                {"role": "user", "content": EXTRACTION_PROMPT},
+            ],
             "stream": False,
             "format": "json",
             "keep_alive": self.keep_alive,
         }
 
-        result = await self._call_ollama("/api/generate", payload)
-        response_text = result.get("response", "")
+        result = await self._call_ollama("/api/chat", payload)
+        response_text = result.get("message", {}).get("content", "")
 
         if not response_text:
             raise RuntimeError(
@@ -136,9 +197,17 @@ class OllamaProvider(AIProvider):
         return self._parse_response_json(response_text, "Ollama")
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create a reusable async HTTP client."""
+        """Get or create a reusable async HTTP client.
+
+        One client serves both pipeline stages and all concurrent batch
+        requests, so each call reuses a warm keep-alive connection rather
+        than paying a fresh TCP handshake.
+        """
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=300.0)
+            self._client = httpx.AsyncClient(
+                timeout=300.0,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
         return self._client
 
     async def _call_ollama(self, endpoint: str, payload: dict) -> dict:
@@ -1,13 +1,17 @@
 """OpenAI provider implementation."""
 
 import asyncio
-import base64
+import contextlib
+import json
+import time
+from collections.abc import Iterator
 
 from namingpaper.config import get_settings
 from namingpaper.models import PDFContent, PaperMetadata
 from namingpaper.providers.base import AIProvider, EXTRACTION_PROMPT
 
 try:
+    import openai
     from openai import OpenAI
 
     OPENAI_AVAILABLE = True
@@ -21,18 +25,64 @@ class OpenAIProvider(AIProvider):
 
     DEFAULT_MODEL = "gpt-4o"
 
+    # Transient failures (RateLimitError, APITimeoutError,
+    # APIConnectionError) are retried by the SDK itself with exponential
+    # backoff that honors Retry-After; the default of 2 gives up too
+    # early under batch-scale rate limiting
+    MAX_RETRIES = 5
+
     def __init__(self, api_key: str, model: str | None = None):
         if not OPENAI_AVAILABLE:
             raise ImportError(
                 "OpenAI package not installed. Run: pip install namingpaper[openai]"
             )
-        self.client = OpenAI(api_key=api_key, timeout=120.0)
+        self.client = OpenAI(api_key=api_key, timeout=120.0, max_retries=self.MAX_RETRIES)
         self.model = model or self.DEFAULT_MODEL
+        # Read once; saves a settings lookup on every extraction
+        self._max_text_chars = get_settings().max_text_chars
 
     async def extract_metadata(self, content: PDFContent) -> PaperMetadata:
         """Extract metadata using OpenAI."""
-        settings = get_settings()
-        text = self._truncate_text(content.text, settings.max_text_chars)
+        # Sync client run in a thread to avoid blocking the event loop
+        return await asyncio.to_thread(self.extract_metadata_sync, content)
+
+    def extract_metadata_sync(self, content: PDFContent) -> PaperMetadata:
+        """Extract metadata using OpenAI (blocking)."""
+        # Call OpenAI API
+        with self._api_errors():
+            response = self.client.chat.completions.create(
+                **self._request_body(content),
+            )
+
+        # Parse response
+        if not response.choices or not response.choices[0].message.content:
+            raise RuntimeError("OpenAI returned an empty response.")
+        response_text = response.choices[0].message.content
+
+        return self._parse_response_json(response_text, "OpenAI")
+
+    @contextlib.contextmanager
+    def _api_errors(self) -> Iterator[None]:
+        """Map OpenAI SDK errors to user-facing RuntimeErrors.
+
+        Typed handlers replace substring sniffing on lowered messages;
+        RateLimitError deliberately passes through so retry/throttling
+        layers can catch it directly.
+        """
+        try:
+            yield
+        except openai.NotFoundError:
+            raise RuntimeError(
+                f"Model '{self.model}' not found. Check available models at https://platform.openai.com/docs/models"
+            )
+        except openai.AuthenticationError:
+            raise RuntimeError(
+                "Invalid OpenAI API key. Check your NAMINGPAPER_OPENAI_API_KEY."
+            )
+
+    def _request_body(self, content: PDFContent) -> dict:
+        """Chat-completions request body for one extraction."""
+        text = self._truncate_text(content.text, self._max_text_chars)
 
         # Build message content
         message_content: list[dict] = []
@@ -47,47 +97,158 @@ class OpenAIProvider(AIProvider):
 
         # Add image if available
         if content.first_page_image:
-            image_data = base64.standard_b64encode(content.first_page_image).decode(
-                "utf-8"
-            )
             message_content.insert(
                 0,
                 {
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{image_data}",
+                        "url": f"data:{content.first_page_image_mime};base64,{content.first_page_image_b64}",
                     },
                 },
             )
 
-        # Call OpenAI API (sync client run in thread to avoid blocking event loop)
-        try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+        return {
+            "model": self.model,
+            "max_tokens": 1024,
+            "messages": [{"role": "user", "content": message_content}],
+        }
+
+    def extract_metadata_multi(
+        self, contents: list[PDFContent], group_size: int = 4
+    ) -> list[PaperMetadata]:
+        """Extract metadata for several PDFs per request.
+
+        Packing group_size papers into one chat completion divides the
+        request count against RPM limits by the group size at no token
+        cost. Falls back to per-PDF calls when any paper needs its image,
+        since vision extraction is tied to single-paper layout.
+        """
+        if any(content.first_page_image for content in contents):
+            return [self.extract_metadata_sync(content) for content in contents]
+
+        results: list[PaperMetadata] = []
+        for start in range(0, len(contents), group_size):
+            group = contents[start : start + group_size]
+            results.extend(self._extract_group(group))
+        return results
+
+    def _extract_group(self, group: list[PDFContent]) -> list[PaperMetadata]:
+        """One chat completion covering every paper in the group."""
+        sections = [
+            f"---PAPER {i}---\n{self._truncate_text(content.text, self._max_text_chars)}"
+            for i, content in enumerate(group, start=1)
+        ]
+        prompt = (
+            f"{EXTRACTION_PROMPT}\n\n"
+            f"There are {len(group)} papers below, separated by ---PAPER i--- "
+            "markers. Return a JSON array with one metadata object per paper, "
+            "in the same order.\n\n" + "\n\n".join(sections)
+        )
+
+        with self._api_errors():
+            response = self.client.chat.completions.create(
                 model=self.model,
-                max_tokens=1024,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": message_content,
-                    },
-                ],
+                max_tokens=1024 * len(group),
+                messages=[{"role": "user", "content": prompt}],
             )
-        except Exception as e:
-            err = str(e).lower()
-            if "model" in err and ("not found" in err or "does not exist" in err):
-                raise RuntimeError(
-                    f"Model '{self.model}' not found. Check available models at https://platform.openai.com/docs/models"
-                ) from e
-            if "auth" in err or "api key" in err:
-                raise RuntimeError(
-                    "Invalid OpenAI API key. Check your NAMINGPAPER_OPENAI_API_KEY."
-                ) from e
-            raise
 
-        # Parse response
         if not response.choices or not response.choices[0].message.content:
             raise RuntimeError("OpenAI returned an empty response.")
-        response_text = response.choices[0].message.content
+        metadata_list = self._parse_response_array(
+            response.choices[0].message.content, expected=len(group)
+        )
+        return metadata_list
 
-        return self._parse_response_json(response_text, "OpenAI")
+    def _parse_response_array(self, response_text: str, expected: int) -> list[PaperMetadata]:
+        """Parse a JSON array response into one PaperMetadata per paper."""
+        text = response_text.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(
+                f"Failed to parse JSON array from OpenAI response: {e}\n"
+                f"Response: {response_text[:500]}"
+            ) from e
+        if not isinstance(data, list) or len(data) != expected:
+            raise RuntimeError(
+                f"OpenAI grouped response had {len(data) if isinstance(data, list) else 'no'} "
+                f"entries, expected {expected}."
+            )
+        return [PaperMetadata.model_validate(entry) for entry in data]
+
+    def submit_batch(self, contents: list[PDFContent]) -> str:
+        """Submit one extraction request per PDF to the Batch API.
+
+        Batched requests run at half price from a separate rate-limit
+        pool with a 24h completion window — suited to corpus-scale
+        reruns, not interactive use. Returns the batch id for
+        await_batch.
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._request_body(content),
+                }
+            )
+            for i, content in enumerate(contents)
+        ]
+        upload = self.client.files.create(
+            file=("namingpaper-batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    def await_batch(
+        self, batch_id: str, expected: int, poll_interval: float = 10.0
+    ) -> list[PaperMetadata]:
+        """Poll a submitted batch until done and parse its results.
+
+        Polling backs off exponentially (capped at 60s); results come
+        back in submission order. The output file carries one line per
+        request in arbitrary order, so `expected` (the submitted request
+        count) is what detects requests the batch silently dropped.
+        """
+        interval = poll_interval
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"OpenAI batch {batch_id} {batch.status}.")
+            time.sleep(interval)
+            interval = min(interval * 2, 60.0)
+
+        output = self.client.files.content(batch.output_file_id).text
+        parsed: dict[str, PaperMetadata] = {}
+        for line in output.splitlines():
+            if not line:
+                continue
+            entry = json.loads(line)
+            if entry.get("error"):
+                raise RuntimeError(
+                    f"OpenAI batch request {entry['custom_id']} failed: {entry['error']}"
+                )
+            response_text = entry["response"]["body"]["choices"][0]["message"]["content"]
+            parsed[entry["custom_id"]] = self._parse_response_json(response_text, "OpenAI")
+
+        missing = [str(i) for i in range(expected) if str(i) not in parsed]
+        if missing:
+            raise RuntimeError(
+                f"OpenAI batch {batch_id} returned no result for "
+                f"request(s) {', '.join(missing)}."
+            )
+        return [parsed[str(i)] for i in range(expected)]
+
+    def extract_metadata_batch(self, contents: list[PDFContent]) -> list[PaperMetadata]:
+        """Submit and wait on a Batch API run in one call."""
+        return self.await_batch(self.submit_batch(contents), expected=len(contents))
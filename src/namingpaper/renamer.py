@@ -1,6 +1,10 @@
 """Safe file renaming operations."""
 
+import errno
+import os
 import shutil
+import stat
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
@@ -26,6 +30,30 @@ def check_collision(destination: Path) -> bool:
     return destination.exists()
 
 
+def check_collisions_bulk(destinations: list[Path]) -> dict[Path, bool]:
+    """Check many destinations for existing files at once.
+
+    Lists each destination directory once with os.scandir and answers every
+    check as a set-membership test, instead of paying a stat syscall per
+    destination as repeated check_collision calls would.
+    """
+    by_parent: dict[Path, list[Path]] = {}
+    for dest in destinations:
+        by_parent.setdefault(dest.parent, []).append(dest)
+
+    results: dict[Path, bool] = {}
+    for parent, dests in by_parent.items():
+        try:
+            with os.scandir(parent) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            # Missing/unreadable directory: nothing there to collide with
+            existing = set()
+        for dest in dests:
+            results[dest] = dest.name in existing
+    return results
+
+
 def get_incremented_path(destination: Path) -> Path:
     """Get a unique path by adding a number suffix.
 
@@ -46,17 +74,39 @@ def get_incremented_path(destination: Path) -> Path:
             raise RenameError(f"Too many collisions for {destination}")
 
 
-def validate_rename(operation: RenameOperation) -> list[str]:
-    """Validate a rename operation, returning list of warnings."""
+@dataclass
+class _ValidationResult:
+    """Validation outcome shared between validate_rename and execute_rename.
+
+    Carrying the collision and same-file answers as flags lets
+    execute_rename reuse them instead of re-stating and re-resolving the
+    same paths — a real cost per file on network filesystems.
+    """
+
+    warnings: list[str]
+    has_collision: bool
+    same_file: bool
+
+
+def _validate(operation: RenameOperation) -> _ValidationResult:
+    """Validate a rename, raising RenameError for hard failures."""
     warnings = []
 
-    # Don't follow symlinks (check before is_file, since symlinks to files pass is_file)
-    if operation.source.is_symlink():
+    # One lstat answers the symlink, regular-file, and existence checks
+    # (lstat does not follow symlinks, so a link is seen as itself).
+    # A stat captured upstream (batch processing) is reused as-is.
+    try:
+        st = operation.source_stat or os.lstat(operation.source)
+    except OSError:
+        raise RenameError(
+            f"Source is not a regular file or does not exist: {operation.source}"
+        )
+    if stat.S_ISLNK(st.st_mode):
         raise RenameError(f"Source is a symlink (not supported): {operation.source}")
-
-    # Check source is a regular file (not directory); is_file() returns False if nonexistent
-    if not operation.source.is_file():
-        raise RenameError(f"Source is not a regular file or does not exist: {operation.source}")
+    if not stat.S_ISREG(st.st_mode):
+        raise RenameError(
+            f"Source is not a regular file or does not exist: {operation.source}"
+        )
 
     # Check destination directory exists
     if not operation.destination.parent.exists():
@@ -65,14 +115,21 @@ def validate_rename(operation: RenameOperation) -> list[str]:
         )
 
     # Check for collision
-    if check_collision(operation.destination):
+    has_collision = check_collision(operation.destination)
+    if has_collision:
         warnings.append(f"Destination already exists: {operation.destination}")
 
     # Check if source and destination are the same
-    if operation.source.resolve() == operation.destination.resolve():
+    same_file = operation.source.resolve() == operation.destination.resolve()
+    if same_file:
         warnings.append("Source and destination are the same file")
 
-    return warnings
+    return _ValidationResult(warnings, has_collision, same_file)
+
+
+def validate_rename(operation: RenameOperation) -> list[str]:
+    """Validate a rename operation, returning list of warnings."""
+    return _validate(operation).warnings
 
 
 def execute_rename(
@@ -91,13 +148,12 @@ def execute_rename(
         The final destination path, or None if skipped
     """
     # Validate first
-    warnings = validate_rename(operation)
-    has_collision = any("Destination already exists" in w for w in warnings)
+    result = _validate(operation)
 
     destination = operation.destination
 
     # Handle collisions
-    if has_collision:
+    if result.has_collision:
         match collision_strategy:
             case CollisionStrategy.SKIP:
                 return None
@@ -106,18 +162,43 @@ def execute_rename(
             case CollisionStrategy.OVERWRITE:
                 pass  # Will overwrite
 
-    # Check same file
-    if operation.source.resolve() == destination.resolve():
+    # Check same file; an incremented destination is new by construction,
+    # so validation's answer still holds and nothing is re-resolved
+    if destination is operation.destination and result.same_file:
         return destination  # No-op, but successful
 
-    # Perform the operation
+    # Perform the operation. replace is a single directory-entry update
+    # when both paths share a filesystem; EXDEV falls back to copy+swap.
     if copy:
         shutil.copy2(operation.source, destination)
     else:
-        operation.source.replace(destination)
+        try:
+            operation.source.replace(destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            _cross_device_move(operation.source, destination)
     return destination
 
 
+def _cross_device_move(source: Path, destination: Path) -> None:
+    """Move a file across filesystems without risking a partial result.
+
+    The copy lands under a temporary name in the destination directory
+    and os.replace publishes it atomically, so a crash mid-copy never
+    leaves a truncated file under the final name. The source is removed
+    only after the destination exists.
+    """
+    tmp = destination.with_name(destination.name + ".part")
+    try:
+        shutil.copy2(source, tmp)
+        os.replace(tmp, destination)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.unlink(source)
+
+
 def preview_rename(operation: RenameOperation, copy: bool = False) -> str:
     """Generate a human-readable preview of the rename operation."""
     source_name = operation.source.name
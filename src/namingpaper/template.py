@@ -1,9 +1,16 @@
 """Template-based filename formatting."""
 
+import functools
 import re
 
 _RE_PLACEHOLDER = re.compile(r"\{(\w+)\}")
 
+_VALID_PLACEHOLDERS = frozenset({
+    "authors", "authors_full", "authors_abbrev",
+    "year", "journal", "journal_abbrev",
+    "journal_full", "title",
+})
+
 from namingpaper.models import PaperMetadata
 from namingpaper.formatter import (
     format_authors,
@@ -38,18 +45,16 @@ def get_template(template_or_name: str) -> str:
     return PRESET_TEMPLATES.get(template_or_name, template_or_name)
 
 
+@functools.lru_cache(maxsize=128)
 def validate_template(template: str) -> tuple[bool, str | None]:
     """Validate a template string.
 
+    Batch runs validate the same template once per file; memoizing makes
+    the repeats a dict hit instead of a regex scan.
+
     Returns:
         Tuple of (is_valid, error_message)
     """
-    valid_placeholders = {
-        "authors", "authors_full", "authors_abbrev",
-        "year", "journal", "journal_abbrev",
-        "journal_full", "title"
-    }
-
     # Find all placeholders in template
     found = _RE_PLACEHOLDER.findall(template)
 
@@ -57,8 +62,8 @@ def validate_template(template: str) -> tuple[bool, str | None]:
         return False, "Template must contain at least one placeholder"
 
     for placeholder in found:
-        if placeholder not in valid_placeholders:
-            return False, f"Invalid placeholder: {{{placeholder}}}. Valid: {valid_placeholders}"
+        if placeholder not in _VALID_PLACEHOLDERS:
+            return False, f"Invalid placeholder: {{{placeholder}}}. Valid: {set(_VALID_PLACEHOLDERS)}"
 
     return True, None
 
@@ -1,18 +1,79 @@
 """Test fixtures for namingpaper."""
 
+import os
+import shutil
+import sys
+import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+import pytest_asyncio
+from typer.testing import CliRunner
 
 from namingpaper.models import PaperMetadata, PDFContent
 from namingpaper.providers.base import AIProvider
-from namingpaper.config import reset_settings
+from namingpaper.config import Settings, reset_settings
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-@pytest.fixture
+# Session-unique /dev/shm basetemp, removed again in pytest_unconfigure.
+# Pytest's own retention pruning only covers numbered dirs under a stable
+# root, so without explicit cleanup these would pile up in RAM across runs.
+_shm_basetemp: str | None = None
+
+
+def pytest_configure(config):
+    """Point tmp_path_factory at tmpfs where available.
+
+    The renamer/batch tests are filesystem-heavy; /dev/shm keeps their
+    writes and renames in RAM. mkdtemp makes the path unique per session
+    — pytest wipes the basetemp at startup, so a fixed path would let
+    two concurrent runs clobber each other. An explicit --basetemp still
+    wins, and other platforms fall back to pytest's default.
+    """
+    global _shm_basetemp
+    if (
+        config.option.basetemp is None
+        and sys.platform == "linux"
+        and Path("/dev/shm").is_dir()
+    ):
+        _shm_basetemp = tempfile.mkdtemp(prefix="pytest-namingpaper-", dir="/dev/shm")
+        config.option.basetemp = _shm_basetemp
+
+
+def pytest_unconfigure(config):
+    """Remove the session's /dev/shm basetemp, if we created one."""
+    global _shm_basetemp
+    if _shm_basetemp is not None:
+        shutil.rmtree(_shm_basetemp, ignore_errors=True)
+        _shm_basetemp = None
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Run tests that need a live Ollama server",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration-marked tests unless --run-integration was given."""
+    if config.getoption("--run-integration"):
+        return
+    skip = pytest.mark.skip(reason="needs --run-integration and a live Ollama server")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
 def sample_metadata() -> PaperMetadata:
-    """Sample paper metadata for testing."""
+    """Sample paper metadata for testing; treated as read-only, so one
+    validated instance serves the whole session."""
     return PaperMetadata(
         authors=["Fama", "French"],
         year=1993,
@@ -62,20 +123,114 @@ def mock_provider(sample_metadata: PaperMetadata) -> MockProvider:
     return MockProvider(sample_metadata)
 
 
+@pytest.fixture(scope="session")
+def extracted_pdf_content() -> PDFContent:
+    """Content of fixtures/sample.pdf, parsed once per session.
+
+    PDF parsing dominates the non-network time of the integration tests;
+    the base64 page image comes free via PDFContent.first_page_image_b64.
+    """
+    from namingpaper.pdf_reader import extract_pdf_content
+
+    return extract_pdf_content(FIXTURES_DIR / "sample.pdf")
+
+
+@pytest_asyncio.fixture(loop_scope="session", scope="session")
+async def http_client():
+    """One pooled httpx client for the live-Ollama integration tests.
+
+    Sharing the client keeps the TCP connection warm between the OCR and
+    metadata-parse calls instead of rebuilding a pool per request. Tests
+    using it must run on the session loop:
+    @pytest.mark.asyncio(loop_scope="session").
+    """
+    async with httpx.AsyncClient(timeout=300.0) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def dummy_pdf(tmp_path_factory) -> Path:
+    """A throwaway "PDF" written once per session.
+
+    Read-only tests can use it in place, sparing a filesystem write per
+    test; tests that rename or delete their source should hardlink it
+    into their own tmp_path first.
+    """
+    path = tmp_path_factory.mktemp("pdfs") / "test.pdf"
+    path.write_bytes(b"PDF content")
+    return path
+
+
+@pytest.fixture(scope="session")
+def fake_provider_sdks():
+    """Seed sys.modules with MagicMock stand-ins for the optional AI SDKs.
+
+    Opt-in and session-scoped, so the sys.modules mutation and import
+    cache churn happen once rather than per test. Real modules, if any
+    were importable, are restored at session end.
+    """
+    saved: dict[str, object | None] = {}
+    for name in ("anthropic", "openai", "google.generativeai"):
+        saved[name] = sys.modules.get(name)
+        sys.modules[name] = MagicMock()
+    yield
+    for name, module in saved.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> Settings:
+    """Default Settings, validated once per session for read-only tests.
+
+    Constructed with NAMINGPAPER_* variables scrubbed so whichever test
+    happens to trigger it first cannot leak its environment into the
+    defaults.
+    """
+    clean = {k: v for k, v in os.environ.items() if not k.startswith("NAMINGPAPER_")}
+    with patch.dict(os.environ, clean, clear=True):
+        return Settings()
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Shared CLI runner; CliRunner is stateless, so one instance serves all tests."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_settings(monkeypatch):
+    """Factory that installs a MagicMock in place of get_settings.
+
+    Call it with field overrides to set the settings the command under
+    test will see; monkeypatch undoes the patch after the test.
+    """
+
+    def _install(**fields) -> MagicMock:
+        settings = MagicMock(**fields)
+        # A MagicMock stand-in (not a lambda) so reset_settings can still
+        # call cache_clear on it during the autouse fixture's teardown
+        monkeypatch.setattr(
+            "namingpaper.config.get_settings", MagicMock(return_value=settings)
+        )
+        return settings
+
+    return _install
+
+
 @pytest.fixture(autouse=True)
-def reset_settings_fixture():
-    """Reset settings before each test."""
+def reset_settings_fixture(monkeypatch):
+    """Reset settings before each test and keep the metadata cache out."""
+    monkeypatch.setenv("NAMINGPAPER_METADATA_CACHE", "0")
     reset_settings()
     yield
     reset_settings()
 
 
-@pytest.fixture
-def temp_pdf(tmp_path: Path) -> Path:
-    """Create a temporary PDF file for testing."""
-    pdf_path = tmp_path / "test_paper.pdf"
-    # Create a minimal valid PDF
-    pdf_content = b"""%PDF-1.4
+# A minimal valid PDF, built once at import instead of per test
+_SAMPLE_PDF_BYTES = b"""%PDF-1.4
 1 0 obj
 << /Type /Catalog /Pages 2 0 R >>
 endobj
@@ -107,5 +262,11 @@ trailer
 startxref
 300
 %%EOF"""
-    pdf_path.write_bytes(pdf_content)
+
+
+@pytest.fixture
+def temp_pdf(tmp_path: Path) -> Path:
+    """Create a temporary PDF file for testing."""
+    pdf_path = tmp_path / "test_paper.pdf"
+    pdf_path.write_bytes(_SAMPLE_PDF_BYTES)
     return pdf_path
@@ -1,7 +1,8 @@
 """Tests for batch processing module."""
 
+import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from namingpaper.models import (
@@ -11,10 +12,14 @@ from namingpaper.models import (
     BatchItemStatus,
 )
 from namingpaper.batch import (
+    TokenBucket,
     scan_directory,
+    process_batch,
     process_single_file,
     detect_batch_collisions,
+    execute_batch_async,
 )
+from namingpaper.renamer import CollisionStrategy
 
 
 class TestScanDirectory:
@@ -146,6 +151,25 @@ class TestDetectBatchCollisions:
         assert result[1].status == BatchItemStatus.ERROR
 
 
+@pytest.mark.asyncio
+class TestTokenBucket:
+    """Tests for the TokenBucket rate limiter."""
+
+    async def test_acquire_within_capacity(self) -> None:
+        """A full bucket should satisfy a request immediately."""
+        bucket = TokenBucket(60)
+        await asyncio.wait_for(bucket.acquire(60), timeout=1.0)
+
+    async def test_oversized_request_clamped(self) -> None:
+        """Requests above capacity must not wait for an unreachable fill.
+
+        Regression test: a per-call token estimate larger than a small
+        tokens-per-minute quota used to spin in acquire forever.
+        """
+        bucket = TokenBucket(60)
+        await asyncio.wait_for(bucket.acquire(10_000), timeout=1.0)
+
+
 @pytest.mark.asyncio
 class TestProcessSingleFile:
     """Tests for process_single_file function."""
@@ -155,7 +179,7 @@ class TestProcessSingleFile:
     ) -> None:
         """Should create BatchItem with OK status on success."""
         pdf_path = tmp_path / "test.pdf"
-        pdf_path.write_bytes(b"%PDF-1.4 fake content")
+        pdf_path.write_bytes(b"%PDF-1.4 fake content".ljust(8192, b" "))
 
         with patch("namingpaper.batch.extract_metadata", new_callable=AsyncMock) as mock_extract:
             mock_extract.return_value = sample_metadata
@@ -170,7 +194,7 @@ class TestProcessSingleFile:
     async def test_extraction_error(self, tmp_path: Path, mock_provider) -> None:
         """Should set ERROR status when extraction fails."""
         pdf_path = tmp_path / "test.pdf"
-        pdf_path.write_bytes(b"%PDF-1.4 fake content")
+        pdf_path.write_bytes(b"%PDF-1.4 fake content".ljust(8192, b" "))
 
         with patch("namingpaper.batch.extract_metadata", new_callable=AsyncMock) as mock_extract:
             mock_extract.side_effect = Exception("API error")
@@ -185,7 +209,7 @@ class TestProcessSingleFile:
     ) -> None:
         """Should detect collision with existing file."""
         pdf_path = tmp_path / "test.pdf"
-        pdf_path.write_bytes(b"%PDF-1.4 fake content")
+        pdf_path.write_bytes(b"%PDF-1.4 fake content".ljust(8192, b" "))
 
         with patch("namingpaper.batch.extract_metadata", new_callable=AsyncMock) as mock_extract:
             mock_extract.return_value = sample_metadata
@@ -200,7 +224,7 @@ class TestProcessSingleFile:
         """Should use output_dir when specified."""
         pdf_path = tmp_path / "input" / "test.pdf"
         pdf_path.parent.mkdir()
-        pdf_path.write_bytes(b"%PDF-1.4 fake content")
+        pdf_path.write_bytes(b"%PDF-1.4 fake content".ljust(8192, b" "))
         output_dir = tmp_path / "output"
         output_dir.mkdir()
 
@@ -211,10 +235,20 @@ class TestProcessSingleFile:
 
         assert item.destination.parent == output_dir
 
+    async def test_too_small_skipped(self, tmp_path: Path, mock_provider) -> None:
+        """Should skip files below the minimum size without calling the provider."""
+        pdf_path = tmp_path / "stub.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 tiny stub")
+
+        item = await process_single_file(pdf_path, mock_provider)
+
+        assert item.status == BatchItemStatus.SKIPPED
+        assert "too small" in item.error
+
     async def test_low_confidence_skipped(self, tmp_path: Path, mock_provider) -> None:
         """Should set SKIPPED status when confidence is below threshold."""
         pdf_path = tmp_path / "test.pdf"
-        pdf_path.write_bytes(b"%PDF-1.4 fake content")
+        pdf_path.write_bytes(b"%PDF-1.4 fake content".ljust(8192, b" "))
 
         with patch("namingpaper.batch.extract_metadata", new_callable=AsyncMock) as mock_extract:
             mock_extract.side_effect = LowConfidenceError(0.1, 0.5)
@@ -223,3 +257,146 @@ class TestProcessSingleFile:
 
         assert item.status == BatchItemStatus.SKIPPED
         assert "not be an academic paper" in item.error
+
+
+@pytest.mark.asyncio
+class TestProcessBatch:
+    """Tests for process_batch function."""
+
+    async def test_duplicate_files_share_one_extraction(
+        self, tmp_path: Path, sample_metadata: PaperMetadata
+    ) -> None:
+        """Identical files should only hit the provider once."""
+        content = b"%PDF-1.4 duplicate content".ljust(8192, b" ")
+        (tmp_path / "copy_a.pdf").write_bytes(content)
+        (tmp_path / "copy_b.pdf").write_bytes(content)
+
+        with patch("namingpaper.batch.extract_metadata", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = sample_metadata
+            items = await process_batch([tmp_path / "copy_a.pdf", tmp_path / "copy_b.pdf"])
+
+        assert mock_extract.call_count == 1
+        assert len(items) == 2
+        assert all(item.metadata is not None for item in items)
+
+    async def test_cache_key_reuses_dedup_digest(
+        self, temp_pdf: Path, mock_provider, monkeypatch
+    ) -> None:
+        """The metadata cache must key on the dedup pass's digest.
+
+        Regression test: the cache key used to hash each file a second
+        time inside extract_metadata, doubling batch I/O for nothing.
+        """
+        from namingpaper.config import reset_settings
+
+        monkeypatch.setenv("NAMINGPAPER_METADATA_CACHE", "1")
+        monkeypatch.setenv("NAMINGPAPER_MIN_PDF_BYTES", "0")
+        reset_settings()
+
+        cache = MagicMock()
+        cache.get.return_value = None
+        monkeypatch.setattr(
+            "namingpaper.extractor.get_cache", MagicMock(return_value=cache)
+        )
+        monkeypatch.setattr(
+            "namingpaper.extractor.content_hash",
+            MagicMock(side_effect=AssertionError("extractor re-hashed the PDF")),
+        )
+
+        with patch("namingpaper.batch.get_cached_provider", return_value=mock_provider):
+            items = await process_batch([temp_pdf])
+
+        assert items[0].status == BatchItemStatus.OK
+        cache.put.assert_called_once()
+
+    async def test_prewarm_called_when_provider_supports_it(
+        self, tmp_path: Path, sample_metadata: PaperMetadata, mock_provider
+    ) -> None:
+        """process_batch must fire the Ollama warm-up, not leave it to a
+        context manager nothing enters."""
+        mock_provider.prewarm = MagicMock()
+        pdf = tmp_path / "a.pdf"
+        pdf.write_bytes(b"%PDF-1.4 content".ljust(8192, b" "))
+
+        with patch("namingpaper.batch.get_cached_provider", return_value=mock_provider):
+            with patch(
+                "namingpaper.batch.extract_metadata", new_callable=AsyncMock
+            ) as mock_extract:
+                mock_extract.return_value = sample_metadata
+                await process_batch([pdf])
+
+        mock_provider.prewarm.assert_called_once()
+
+    async def test_shared_prefix_files_stay_distinct(
+        self, tmp_path: Path, sample_metadata: PaperMetadata
+    ) -> None:
+        """Same-size files differing only past the first 4KB are not merged."""
+        prefix = b"%PDF-1.4 shared prefix".ljust(8192, b" ")
+        (tmp_path / "a.pdf").write_bytes(prefix + b"tail-a")
+        (tmp_path / "b.pdf").write_bytes(prefix + b"tail-b")
+
+        with patch("namingpaper.batch.extract_metadata", new_callable=AsyncMock) as mock_extract:
+            mock_extract.return_value = sample_metadata
+            await process_batch([tmp_path / "a.pdf", tmp_path / "b.pdf"])
+
+        assert mock_extract.call_count == 2
+
+
+@pytest.mark.asyncio
+class TestExecuteBatch:
+    """Tests for execute_batch_async."""
+
+    def _shared_dest_items(
+        self, tmp_path: Path, metadata: PaperMetadata, count: int = 8
+    ) -> list[BatchItem]:
+        """Distinct sources that all map to one destination."""
+        items = []
+        for i in range(count):
+            source = tmp_path / f"source_{i}.pdf"
+            source.write_bytes(b"%%PDF-1.4 content %d" % i)
+            items.append(
+                BatchItem(
+                    source=source,
+                    destination=tmp_path / "Same Name.pdf",
+                    metadata=metadata,
+                    status=BatchItemStatus.OK,
+                )
+            )
+        return items
+
+    async def test_shared_destination_skip_keeps_later_sources(
+        self, tmp_path: Path, sample_metadata: PaperMetadata
+    ) -> None:
+        """Concurrent renames to one destination must not lose sources.
+
+        Regression test: the fully concurrent execute phase let every
+        item pass the collision check before any file existed, so all
+        eight replaced the same name and seven sources vanished.
+        """
+        items = self._shared_dest_items(tmp_path, sample_metadata)
+
+        result = await execute_batch_async(
+            items, collision_strategy=CollisionStrategy.SKIP
+        )
+
+        assert result.successful == 1
+        assert result.skipped == 7
+        # Skipped sources stay on disk untouched
+        remaining = {p.name for p in tmp_path.iterdir()}
+        assert "Same Name.pdf" in remaining
+        assert sum(name.startswith("source_") for name in remaining) == 7
+
+    async def test_shared_destination_increment_keeps_all(
+        self, tmp_path: Path, sample_metadata: PaperMetadata
+    ) -> None:
+        """INCREMENT should yield one distinct file per source."""
+        items = self._shared_dest_items(tmp_path, sample_metadata)
+
+        result = await execute_batch_async(
+            items, collision_strategy=CollisionStrategy.INCREMENT
+        )
+
+        assert result.successful == 8
+        destinations = {item.destination for item in items}
+        assert len(destinations) == 8
+        assert all(dest.exists() for dest in destinations)
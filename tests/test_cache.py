@@ -0,0 +1,116 @@
+"""Tests for the metadata cache."""
+
+from pathlib import Path
+
+from namingpaper.cache import MetadataCache, content_hash
+from namingpaper.extractor import _cache_key
+from namingpaper.models import PaperMetadata
+
+
+class TestContentHash:
+    """Tests for content_hash function."""
+
+    def test_stable_for_same_bytes(self, tmp_path: Path) -> None:
+        """Identical content should hash identically regardless of name."""
+        a = tmp_path / "a.pdf"
+        b = tmp_path / "b.pdf"
+        a.write_bytes(b"%PDF-1.4 same content")
+        b.write_bytes(b"%PDF-1.4 same content")
+
+        assert content_hash(a) == content_hash(b)
+
+    def test_differs_for_different_bytes(self, tmp_path: Path) -> None:
+        """Different content should produce different hashes."""
+        a = tmp_path / "a.pdf"
+        b = tmp_path / "b.pdf"
+        a.write_bytes(b"%PDF-1.4 one")
+        b.write_bytes(b"%PDF-1.4 two")
+
+        assert content_hash(a) != content_hash(b)
+
+
+class TestCacheKey:
+    """Tests for the extractor's metadata-cache key."""
+
+    def test_key_separates_providers_and_models(self, tmp_path: Path, monkeypatch) -> None:
+        """A provider or model switch must never hit the other's entries.
+
+        Regression test: the key used to omit the provider, so running
+        --provider claude after an Ollama pass served Ollama-derived
+        metadata as a cache hit.
+        """
+        from namingpaper.config import reset_settings
+
+        monkeypatch.setenv("NAMINGPAPER_METADATA_CACHE", "1")
+        reset_settings()
+        pdf = tmp_path / "paper.pdf"
+        pdf.write_bytes(b"%PDF-1.4 content")
+
+        keys = {
+            _cache_key(pdf, provider_name="ollama"),
+            _cache_key(pdf, provider_name="claude"),
+            _cache_key(pdf, provider_name="claude", model_name="claude-3-5-haiku"),
+            _cache_key(pdf, provider_name="ollama", ocr_model="deepseek-ocr"),
+        }
+        assert len(keys) == 4
+
+    def test_ocr_model_ignored_off_ollama(self, tmp_path: Path, monkeypatch) -> None:
+        """Non-Ollama providers never run OCR, so its model cannot fork keys."""
+        from namingpaper.config import reset_settings
+
+        monkeypatch.setenv("NAMINGPAPER_METADATA_CACHE", "1")
+        reset_settings()
+        pdf = tmp_path / "paper.pdf"
+        pdf.write_bytes(b"%PDF-1.4 content")
+
+        assert _cache_key(pdf, provider_name="claude") == _cache_key(
+            pdf, provider_name="claude", ocr_model="deepseek-ocr"
+        )
+
+
+class TestNoCacheFlag:
+    """The explicit cache=False opt-out behind the CLI's --no-cache."""
+
+    def test_cache_false_never_touches_the_cache(
+        self, temp_pdf: Path, mock_provider, monkeypatch
+    ) -> None:
+        """cache=False must bypass the cache even when settings enable it.
+
+        Regression test: --no-cache used to flip the
+        NAMINGPAPER_METADATA_CACHE env var, which a config-file
+        metadata_cache entry silently overrode.
+        """
+        from unittest.mock import MagicMock
+
+        from namingpaper.config import reset_settings
+        from namingpaper.extractor import extract_metadata_sync
+
+        monkeypatch.setenv("NAMINGPAPER_METADATA_CACHE", "1")
+        reset_settings()
+        spy = MagicMock()
+        monkeypatch.setattr("namingpaper.extractor.get_cache", spy)
+
+        extract_metadata_sync(temp_pdf, provider=mock_provider, cache=False)
+
+        spy.assert_not_called()
+
+
+class TestMetadataCache:
+    """Tests for MetadataCache."""
+
+    def test_roundtrip(self, tmp_path: Path, sample_metadata: PaperMetadata) -> None:
+        """Stored metadata should come back equal."""
+        cache = MetadataCache(tmp_path / "cache.db")
+        try:
+            cache.put("abc123", sample_metadata)
+            assert cache.get("abc123") == sample_metadata
+        finally:
+            cache.close()
+
+    def test_miss_returns_none(self, tmp_path: Path) -> None:
+        """Unknown hashes should return None."""
+        cache = MetadataCache(tmp_path / "cache.db")
+        try:
+            assert cache.get("missing") is None
+        finally:
+            cache.close()
@@ -1,13 +1,14 @@
 """Tests for configuration management."""
 
 import pytest
+from pydantic import ValidationError
 
 from namingpaper.config import Settings, get_settings, reset_settings
 
 
 class TestSettings:
-    def test_default_values(self):
-        settings = Settings()
+    def test_default_values(self, default_settings):
+        settings = default_settings
         assert settings.ai_provider == "ollama"
         assert settings.max_authors == 3
         assert settings.max_filename_length == 200
@@ -30,25 +31,20 @@ class TestSettings:
         assert settings.max_authors == 5
         assert settings.max_filename_length == 150
 
-    def test_invalid_provider_rejected(self):
-        with pytest.raises(Exception):
-            Settings(ai_provider="invalid")
-
-    def test_max_authors_minimum(self):
-        with pytest.raises(Exception):
-            Settings(max_authors=0)
-
-    def test_max_filename_length_bounds(self):
-        with pytest.raises(Exception):
-            Settings(max_filename_length=10)
-        with pytest.raises(Exception):
-            Settings(max_filename_length=300)
-
-    def test_min_confidence_bounds(self):
-        with pytest.raises(Exception):
-            Settings(min_confidence=-0.1)
-        with pytest.raises(Exception):
-            Settings(min_confidence=1.5)
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"ai_provider": "invalid"},
+            {"max_authors": 0},
+            {"max_filename_length": 10},
+            {"max_filename_length": 300},
+            {"min_confidence": -0.1},
+            {"min_confidence": 1.5},
+        ],
+    )
+    def test_rejects_invalid(self, kwargs):
+        with pytest.raises(ValidationError):
+            Settings(**kwargs)
 
     def test_extra_fields_ignored(self):
         settings = Settings(unknown_field="value")
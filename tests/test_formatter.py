@@ -96,3 +96,18 @@ class TestBuildFilename:
         filename = build_filename(sample_metadata, max_filename_length=50)
         assert len(filename) <= 50
         assert filename.endswith(".pdf")
+
+    def test_sanitizes_but_preserves_metadata(self):
+        # Filename characters are cleaned at the formatting boundary;
+        # the stored metadata keeps the paper's real punctuation
+        metadata = PaperMetadata(
+            authors=["Smith"],
+            year=2020,
+            journal="Journal: A/B",
+            title='Deep learning: a "modern" approach?',
+            confidence=0.9,
+        )
+        filename = build_filename(metadata)
+        assert not set('<>:"/\\|?*') & set(filename)
+        assert metadata.title == 'Deep learning: a "modern" approach?'
+        assert metadata.journal == "Journal: A/B"
@@ -3,39 +3,29 @@
 
 Requires a running Ollama server with the glm-ocr model.
 """
-import asyncio
-import base64
 import json
 import time
 from pathlib import Path
 
 import pytest
-import httpx
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 SAMPLE_PDF = FIXTURES_DIR / "sample.pdf"
 
 
-@pytest.mark.skip(reason="Requires local Ollama server with glm-ocr model")
-async def test_glm_ocr():
-    pdf_path = SAMPLE_PDF
+@pytest.mark.integration
+@pytest.mark.asyncio(loop_scope="session")
+async def test_glm_ocr(extracted_pdf_content, http_client):
+    print(f"Testing with: {SAMPLE_PDF.name}\n")
 
-    print(f"Testing with: {pdf_path.name}\n")
-
-    # Read first page as image
-    from namingpaper.pdf_reader import extract_pdf_content
-
-    print("Extracting PDF content...")
-    start_time = time.time()
-    content = extract_pdf_content(pdf_path)
-    extract_time = time.time() - start_time
-    print(f"✓ PDF extraction took: {extract_time:.2f}s")
+    # Sample PDF is parsed once per session by the conftest fixture
+    content = extracted_pdf_content
 
     if not content.first_page_image:
         print("No image found, skipping OCR test")
         return
 
-    image_b64 = base64.standard_b64encode(content.first_page_image).decode("utf-8")
+    image_b64 = content.first_page_image_b64
 
     payload = {
         "model": "glm-ocr",
@@ -52,12 +42,11 @@ async def test_glm_ocr():
 
     print("\nCalling glm-ocr...")
     ocr_start = time.time()
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        response = await client.post(
-            "http://localhost:11434/api/chat",
-            json=payload,
-        )
-        result = response.json()
+    response = await http_client.post(
+        "http://localhost:11434/api/chat",
+        json=payload,
+    )
+    result = response.json()
     ocr_time = time.time() - ocr_start
     print(f"✓ OCR processing took: {ocr_time:.2f}s")
 
@@ -70,10 +59,4 @@ async def test_glm_ocr():
         print(ocr_text[:1000])
 
     print(f"\n=== TIMING SUMMARY ===")
-    print(f"PDF extraction: {extract_time:.2f}s")
     print(f"OCR processing: {ocr_time:.2f}s")
-    print(f"Total time:     {extract_time + ocr_time:.2f}s")
-
-
-if __name__ == "__main__":
-    asyncio.run(test_glm_ocr())
@@ -0,0 +1,24 @@
+"""Tests for data models."""
+
+from pathlib import Path
+
+import pytest
+
+from namingpaper.models import PDFContent
+
+
+class TestFirstPageImageMime:
+    """Tests for PDFContent.first_page_image_mime."""
+
+    @pytest.mark.parametrize(
+        "image,mime",
+        [
+            (b"\x89PNG\r\n\x1a\n rest", "image/png"),
+            (b"\xff\xd8\xff\xe0 jpeg bytes", "image/jpeg"),
+            (None, None),
+        ],
+    )
+    def test_sniffs_magic_bytes(self, image: bytes | None, mime: str | None) -> None:
+        """Embedded PNGs must be declared as PNG, everything else as JPEG."""
+        content = PDFContent(text="text", first_page_image=image, path=Path("/tmp/x.pdf"))
+        assert content.first_page_image_mime == mime
@@ -0,0 +1,93 @@
+"""Offline tests for the Ollama provider pipeline.
+
+Canned API responses from tests/fixtures/ ride an httpx.MockTransport,
+so the two-stage OCR + parse flow is exercised without a live server or
+LLM inference latency.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+from namingpaper.models import PDFContent
+from namingpaper.providers.ollama import OllamaProvider
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+_OCR_RESPONSE = json.loads((FIXTURES_DIR / "ollama_ocr_response.json").read_text())
+_PARSE_RESPONSE = json.loads((FIXTURES_DIR / "ollama_parse_response.json").read_text())
+
+# Text layer good enough that the provider should skip the OCR stage
+REAL_TEXT = (
+    "Common risk factors in the returns on stocks and bonds. "
+    "Journal of Financial Economics 33 (1993) 3-56. Abstract: "
+    "This paper identifies five common risk factors in the returns "
+    "on stocks and bonds."
+)
+
+
+@pytest.fixture
+def offline_provider():
+    """OllamaProvider answered by canned responses; records models called."""
+    provider = OllamaProvider()
+    provider.models_called = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        provider.models_called.append(payload.get("model"))
+        if payload.get("model") == provider.ocr_model:
+            return httpx.Response(200, json=_OCR_RESPONSE)
+        return httpx.Response(200, json=_PARSE_RESPONSE)
+
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return provider
+
+
+class TestOllamaPipeline:
+    async def test_scanned_pdf_runs_ocr_then_parse(self, offline_provider):
+        content = PDFContent(
+            text="", first_page_image=b"\xff\xd8\xff fake jpeg", path=Path("/tmp/scan.pdf")
+        )
+        metadata = await offline_provider.extract_metadata(content)
+
+        assert offline_provider.models_called == [
+            offline_provider.ocr_model,
+            offline_provider.text_model,
+        ]
+        assert metadata.authors == ["Fama", "French"]
+        assert metadata.year == 1993
+        await offline_provider.aclose()
+
+    async def test_real_text_layer_skips_ocr(self, offline_provider):
+        content = PDFContent(
+            text=REAL_TEXT, first_page_image=b"\xff\xd8\xff fake jpeg", path=Path("/tmp/x.pdf")
+        )
+        metadata = await offline_provider.extract_metadata(content)
+
+        assert offline_provider.models_called == [offline_provider.text_model]
+        assert metadata.title.startswith("Common risk factors")
+        await offline_provider.aclose()
+
+    async def test_missing_model_raises_with_pull_hint(self, offline_provider):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"error": "model not found"})
+
+        offline_provider._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        content = PDFContent(text=REAL_TEXT, first_page_image=None, path=Path("/tmp/x.pdf"))
+
+        with pytest.raises(RuntimeError, match="ollama pull"):
+            await offline_provider.extract_metadata(content)
+        await offline_provider.aclose()
+
+    async def test_prewarm_issues_text_model_load(self, offline_provider):
+        """prewarm must actually send the zero-token load request."""
+        offline_provider.prewarm()
+        await asyncio.gather(*offline_provider._warmup_tasks)
+
+        assert offline_provider.models_called == [offline_provider.text_model]
+        await offline_provider.aclose()
@@ -0,0 +1,26 @@
+"""Tests for PDF content extraction."""
+
+from pathlib import Path
+
+from namingpaper.config import reset_settings
+from namingpaper.pdf_reader import extract_pdf_content
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestTextBudget:
+    """Tests for the max_chars text budget."""
+
+    def test_default_budget_follows_settings(self, monkeypatch) -> None:
+        """NAMINGPAPER_MAX_TEXT_CHARS must govern the extracted text size."""
+        monkeypatch.setenv("NAMINGPAPER_MAX_TEXT_CHARS", "100")
+        reset_settings()
+        content = extract_pdf_content(FIXTURES_DIR / "sample.pdf", extract_image=False)
+        assert len(content.text) <= 100
+
+    def test_explicit_budget_wins(self) -> None:
+        """An explicit max_chars overrides the setting."""
+        content = extract_pdf_content(
+            FIXTURES_DIR / "sample.pdf", extract_image=False, max_chars=2
+        )
+        assert len(content.text) <= 2
@@ -0,0 +1,53 @@
+"""Tests for shared provider helpers."""
+
+import pytest
+
+from namingpaper.providers.base import JsonBraceCounter
+
+
+class TestJsonBraceCounter:
+    """Tests for the streaming early-exit brace tracker."""
+
+    def _feed_chunks(self, text: str, depth: int = 0, size: int = 3) -> JsonBraceCounter:
+        """Feed text in small chunks so state must survive chunk boundaries."""
+        tracker = JsonBraceCounter(depth=depth)
+        for start in range(0, len(text), size):
+            tracker.feed(text[start : start + size])
+            if tracker.closed:
+                break
+        return tracker
+
+    def test_plain_object_closes(self) -> None:
+        tracker = self._feed_chunks('{"year": 1993}')
+        assert tracker.closed
+
+    def test_not_closed_before_object_opens(self) -> None:
+        """Leading prose must not count as a closed object."""
+        tracker = JsonBraceCounter()
+        tracker.feed("Here is the metadata: ")
+        assert not tracker.closed
+
+    @pytest.mark.parametrize(
+        "title",
+        [
+            "Sets, braces {and} other notation",
+            "The } problem in parsing",
+            'Escaped \\" quote, then a } brace',
+        ],
+    )
+    def test_braces_inside_strings_ignored(self, title: str) -> None:
+        """A brace in a quoted value must not end the object early.
+
+        Regression test: the old per-chunk count("{") - count("}") scan
+        truncated the stream on titles containing a closing brace.
+        """
+        body = '"title": "%s", "year": 2020}' % title
+        tracker = self._feed_chunks(body, depth=1)  # prefilled "{" case
+        assert tracker.closed
+        # closed must flip exactly at the final brace, not inside the title
+        before_final = self._feed_chunks(body[:-1], depth=1)
+        assert not before_final.closed
+
+    def test_nested_objects(self) -> None:
+        tracker = self._feed_chunks('{"a": {"b": "}"}, "c": 1}')
+        assert tracker.closed
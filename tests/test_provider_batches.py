@@ -0,0 +1,228 @@
+"""Offline tests for the Claude and OpenAI batch extraction APIs.
+
+The SDKs are faked via fake_provider_sdks and each provider's client is
+replaced with a MagicMock, so these cover request assembly, result
+reassembly, and error surfacing without any network or optional
+dependency.
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from namingpaper.models import PDFContent
+
+
+def _metadata_json(title: str, year: int = 2020) -> str:
+    return json.dumps(
+        {
+            "authors": ["Smith"],
+            "year": year,
+            "journal": "Journal of Tests",
+            "title": title,
+            "confidence": 0.9,
+        }
+    )
+
+
+def _contents(n: int) -> list[PDFContent]:
+    return [
+        PDFContent(text=f"paper {i}", path=Path(f"/tmp/paper{i}.pdf"))
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def claude_provider(fake_provider_sdks):
+    """ClaudeProvider with a mocked SDK client.
+
+    Imported inside the fixture so the module loads against the faked
+    anthropic package.
+    """
+    from namingpaper.providers import claude
+
+    # _api_errors evaluates these in except clauses, so the fakes must be
+    # real exception types
+    claude.anthropic.NotFoundError = type("NotFoundError", (Exception,), {})
+    claude.anthropic.AuthenticationError = type("AuthenticationError", (Exception,), {})
+    provider = claude.ClaudeProvider(api_key="sk-test")
+    provider.client = MagicMock()
+    return provider
+
+
+def _claude_entry(custom_id: str, title: str, year: int) -> MagicMock:
+    """One succeeded entry from the Message Batches results stream."""
+    entry = MagicMock()
+    entry.custom_id = custom_id
+    entry.result.type = "succeeded"
+    # Responses continue the "{" prefill, so the leading brace is absent
+    entry.result.message.content = [MagicMock(text=_metadata_json(title, year)[1:])]
+    return entry
+
+
+class TestClaudeBatch:
+    """Tests for ClaudeProvider.extract_metadata_batch."""
+
+    def test_results_reassembled_in_input_order(self, claude_provider) -> None:
+        """The results stream has no order guarantee."""
+        batches = claude_provider.client.messages.batches
+        batches.create.return_value = MagicMock(processing_status="ended")
+        batches.results.return_value = [
+            _claude_entry("1", "Second paper", 2021),
+            _claude_entry("0", "First paper", 2020),
+        ]
+
+        results = claude_provider.extract_metadata_batch(_contents(2))
+
+        assert [m.title for m in results] == ["First paper", "Second paper"]
+
+    def test_missing_result_raises(self, claude_provider) -> None:
+        """A silently dropped request must fail loudly, not KeyError."""
+        batches = claude_provider.client.messages.batches
+        batches.create.return_value = MagicMock(processing_status="ended")
+        batches.results.return_value = [_claude_entry("0", "Only paper", 2020)]
+
+        with pytest.raises(RuntimeError, match="no result for request"):
+            claude_provider.extract_metadata_batch(_contents(2))
+
+    def test_failed_entry_raises(self, claude_provider) -> None:
+        batches = claude_provider.client.messages.batches
+        batches.create.return_value = MagicMock(processing_status="ended")
+        failed = MagicMock()
+        failed.custom_id = "0"
+        failed.result.type = "errored"
+        batches.results.return_value = [failed]
+
+        with pytest.raises(RuntimeError, match="failed"):
+            claude_provider.extract_metadata_batch(_contents(1))
+
+
+@pytest.fixture
+def openai_provider(fake_provider_sdks):
+    """OpenAIProvider with a mocked SDK client."""
+    from namingpaper.providers import openai as openai_provider_module
+
+    openai_provider_module.openai.NotFoundError = type(
+        "NotFoundError", (Exception,), {}
+    )
+    openai_provider_module.openai.AuthenticationError = type(
+        "AuthenticationError", (Exception,), {}
+    )
+    provider = openai_provider_module.OpenAIProvider(api_key="sk-test")
+    provider.client = MagicMock()
+    return provider
+
+
+def _openai_response(payload: str) -> MagicMock:
+    """One chat-completions response carrying the given content."""
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=payload))]
+    return response
+
+
+class TestOpenAIMulti:
+    """Tests for OpenAIProvider.extract_metadata_multi."""
+
+    def test_groups_papers_per_request(self, openai_provider) -> None:
+        """Five text-only papers at group_size=2 need three requests."""
+        titles = [f"Paper {i}" for i in range(5)]
+        openai_provider.client.chat.completions.create.side_effect = [
+            _openai_response(json.dumps([json.loads(_metadata_json(t)) for t in group]))
+            for group in (titles[0:2], titles[2:4], titles[4:5])
+        ]
+
+        results = openai_provider.extract_metadata_multi(_contents(5), group_size=2)
+
+        assert openai_provider.client.chat.completions.create.call_count == 3
+        assert [m.title for m in results] == titles
+
+    def test_falls_back_per_pdf_with_images(self, openai_provider) -> None:
+        """Vision extraction stays single-paper."""
+        contents = _contents(2)
+        contents[0].first_page_image = b"\xff\xd8\xff\xe0 jpeg"
+        openai_provider.client.chat.completions.create.side_effect = [
+            _openai_response(_metadata_json("Paper 0")),
+            _openai_response(_metadata_json("Paper 1")),
+        ]
+
+        results = openai_provider.extract_metadata_multi(contents, group_size=2)
+
+        assert openai_provider.client.chat.completions.create.call_count == 2
+        assert [m.title for m in results] == ["Paper 0", "Paper 1"]
+
+    def test_wrong_entry_count_raises(self, openai_provider) -> None:
+        openai_provider.client.chat.completions.create.return_value = _openai_response(
+            json.dumps([json.loads(_metadata_json("Only one"))])
+        )
+
+        with pytest.raises(RuntimeError, match="expected 2"):
+            openai_provider.extract_metadata_multi(_contents(2), group_size=2)
+
+
+def _batch_output_line(custom_id: str, title: str, year: int) -> str:
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {
+                "body": {
+                    "choices": [{"message": {"content": _metadata_json(title, year)}}]
+                }
+            },
+        }
+    )
+
+
+class TestOpenAIBatch:
+    """Tests for OpenAIProvider.submit_batch / await_batch."""
+
+    def test_submit_uploads_one_line_per_pdf(self, openai_provider) -> None:
+        openai_provider.client.files.create.return_value = MagicMock(id="file_1")
+        openai_provider.client.batches.create.return_value = MagicMock(id="batch_1")
+
+        batch_id = openai_provider.submit_batch(_contents(2))
+
+        assert batch_id == "batch_1"
+        _, payload = openai_provider.client.files.create.call_args.kwargs["file"]
+        lines = [json.loads(line) for line in payload.decode("utf-8").splitlines()]
+        assert [entry["custom_id"] for entry in lines] == ["0", "1"]
+        assert all(entry["url"] == "/v1/chat/completions" for entry in lines)
+
+    def test_await_reassembles_in_submission_order(self, openai_provider) -> None:
+        """Output lines arrive in completion order, not submission order."""
+        openai_provider.client.batches.retrieve.return_value = MagicMock(
+            status="completed", output_file_id="out_1"
+        )
+        openai_provider.client.files.content.return_value.text = "\n".join(
+            [
+                _batch_output_line("1", "Second paper", 2021),
+                _batch_output_line("0", "First paper", 2020),
+            ]
+        )
+
+        results = openai_provider.await_batch("batch_1", expected=2)
+
+        assert [m.title for m in results] == ["First paper", "Second paper"]
+
+    def test_await_missing_line_raises(self, openai_provider) -> None:
+        """A dropped output line must raise, not truncate the results.
+
+        Regression test: reassembly used range(len(parsed)), which
+        silently shortened the list (or KeyErrored) on missing lines.
+        """
+        openai_provider.client.batches.retrieve.return_value = MagicMock(
+            status="completed", output_file_id="out_1"
+        )
+        openai_provider.client.files.content.return_value.text = _batch_output_line(
+            "0", "Only paper", 2020
+        )
+
+        with pytest.raises(RuntimeError, match="no result for request"):
+            openai_provider.await_batch("batch_1", expected=2)
+
+    def test_await_failed_batch_raises(self, openai_provider) -> None:
+        openai_provider.client.batches.retrieve.return_value = MagicMock(status="failed")
+
+        with pytest.raises(RuntimeError, match="failed"):
+            openai_provider.await_batch("batch_1", expected=1)
@@ -1,5 +1,7 @@
 """Tests for file renaming operations."""
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -16,11 +18,41 @@ from namingpaper.renamer import (
 )
 
 
+# What every hardlinked test PDF contains; content assertions compare
+# bytes against this instead of re-reading the source through a codec
+_PDF_BYTES = b"PDF content"
+
+
+def _names(directory: Path) -> set[str]:
+    """Entry names in a directory from a single scandir pass; cheaper
+    than stat-ing each path of interest via Path.exists."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+
+def _touch(path: Path) -> None:
+    """Create an empty file with one open syscall; collision probes only
+    care that a directory entry exists, not what it holds."""
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+
+
+@pytest.fixture(scope="module")
+def _pdf_pool(tmp_path_factory) -> Path:
+    """Template PDF written once per module; tests hardlink it rather
+    than rewriting the same bytes per test."""
+    template = tmp_path_factory.mktemp("pdfpool") / "template.pdf"
+    template.write_bytes(_PDF_BYTES)
+    return template
+
+
 @pytest.fixture
-def temp_pdf_file(tmp_path: Path) -> Path:
-    """Create a temporary PDF file."""
+def temp_pdf_file(_pdf_pool: Path, tmp_path: Path) -> Path:
+    """Hand each test its own hardlinked copy of the template PDF."""
     pdf_path = tmp_path / "original.pdf"
-    pdf_path.write_text("PDF content")
+    try:
+        os.link(_pdf_pool, pdf_path)
+    except OSError:  # filesystem without hardlink support
+        shutil.copyfile(_pdf_pool, pdf_path)
     return pdf_path
 
 
@@ -47,16 +79,16 @@ class TestCheckCollision:
 class TestGetIncrementedPath:
     def test_increments_filename(self, tmp_path: Path):
         # Create existing file
-        (tmp_path / "paper.pdf").write_text("content")
+        _touch(tmp_path / "paper.pdf")
 
         result = get_incremented_path(tmp_path / "paper.pdf")
         assert result == tmp_path / "paper (1).pdf"
 
     def test_increments_multiple(self, tmp_path: Path):
         # Create multiple existing files
-        (tmp_path / "paper.pdf").write_text("content")
-        (tmp_path / "paper (1).pdf").write_text("content")
-        (tmp_path / "paper (2).pdf").write_text("content")
+        _touch(tmp_path / "paper.pdf")
+        _touch(tmp_path / "paper (1).pdf")
+        _touch(tmp_path / "paper (2).pdf")
 
         result = get_incremented_path(tmp_path / "paper.pdf")
         assert result == tmp_path / "paper (3).pdf"
@@ -89,15 +121,18 @@ class TestValidateRename:
             metadata=sample_metadata,
         )
         warnings = validate_rename(operation)
-        assert any("already exists" in w for w in warnings)
+        # Exact comparison: one equality check instead of a generator of
+        # substring scans, and it catches unexpected extra warnings too
+        assert warnings == [f"Destination already exists: {dest}"]
 
 
 class TestExecuteRename:
     def test_successful_rename(self, sample_operation: RenameOperation):
         result = execute_rename(sample_operation)
         assert result == sample_operation.destination
-        assert sample_operation.destination.exists()
-        assert not sample_operation.source.exists()
+        names = _names(sample_operation.source.parent)
+        assert sample_operation.destination.name in names
+        assert sample_operation.source.name not in names
 
     def test_skip_on_collision(
         self, temp_pdf_file: Path, sample_metadata: PaperMetadata
@@ -138,8 +173,7 @@ class TestExecuteRename:
     ):
         # Create destination with different content
         dest = temp_pdf_file.parent / "dest.pdf"
-        dest.write_text("old content")
-        original_content = temp_pdf_file.read_text()
+        dest.write_bytes(b"old content")
 
         operation = RenameOperation(
             source=temp_pdf_file,
@@ -150,7 +184,22 @@ class TestExecuteRename:
             operation, collision_strategy=CollisionStrategy.OVERWRITE
         )
         assert result == dest
-        assert dest.read_text() == original_content
+        assert dest.read_bytes() == _PDF_BYTES
+
+    def test_cross_device_fallback(
+        self, sample_operation: RenameOperation, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Simulate rename across filesystems (EXDEV) to hit the copy+swap path
+        import errno
+
+        def raise_exdev(self, target):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(Path, "replace", raise_exdev)
+        result = execute_rename(sample_operation)
+        assert result == sample_operation.destination
+        assert sample_operation.destination.read_bytes() == _PDF_BYTES
+        assert not sample_operation.source.exists()
 
 
 class TestPreviewRename: